@@ -9,6 +9,9 @@ from .regrs import (
     Hive,
     RegistryKey,
     RegistryValue,
+    HiveBuffer,
+    SubkeyIter,
+    ValueIter,
     ValueData,
     ValueType,
     BaseBlock,
@@ -20,6 +23,9 @@ __all__ = [
     "Hive",
     "RegistryKey",
     "RegistryValue",
+    "HiveBuffer",
+    "SubkeyIter",
+    "ValueIter",
     "ValueData",
     "ValueType",
     "BaseBlock",
@@ -5,7 +5,7 @@ This module provides Python bindings for the high-performance Windows Registry
 hive parser written in Rust.
 """
 
-from typing import Optional, List
+from typing import Callable, Iterator, List, Optional, Tuple
 
 __version__: str
 
@@ -15,37 +15,33 @@ class BaseBlock:
     
     The base block contains metadata about the hive including signatures,
     sequence numbers, and the root key offset.
+    
+    All fields are plain instance attributes, filled in when the object is
+    created. They are writable: assigning or deleting one only changes this
+    object (repr() shows the current attributes), not the hive, and
+    Hive.base_block() always returns a fresh copy.
     """
     
-    @property
-    def signature(self) -> str:
-        """Get the signature (should be "regf")."""
-        ...
+    signature: str
+    """The signature (should be "regf")."""
     
-    @property
-    def primary_sequence(self) -> int:
-        """Get the primary sequence number."""
-        ...
+    primary_sequence: int
+    """The primary sequence number."""
     
-    @property
-    def secondary_sequence(self) -> int:
-        """Get the secondary sequence number."""
-        ...
+    secondary_sequence: int
+    """The secondary sequence number."""
     
-    @property
-    def root_cell_offset(self) -> int:
-        """Get the root cell offset."""
-        ...
+    root_cell_offset: int
+    """The root cell offset."""
     
-    @property
-    def hive_bins_data_size(self) -> int:
-        """Get the hive bins data size."""
-        ...
+    hive_length: int
+    """The hive length (size of hive data in bytes)."""
     
-    @property
-    def file_name(self) -> Optional[str]:
-        """Get the file name (if present)."""
-        ...
+    hive_bins_data_size: int
+    """The hive bins data size (same as hive_length)."""
+    
+    file_name: str
+    """The file name embedded in the header."""
     
     def __repr__(self) -> str: ...
 
@@ -54,22 +50,20 @@ class HbinHeader:
     Represents a hive bin (hbin) header.
     
     Hive bins are 4KB-aligned blocks that contain cells.
+    
+    All fields are plain instance attributes, filled in when the object is
+    created. Like BaseBlock's, they are writable and only describe this
+    object.
     """
     
-    @property
-    def signature(self) -> str:
-        """Get the signature (should be "hbin")."""
-        ...
+    signature: str
+    """The signature (should be "hbin")."""
     
-    @property
-    def offset(self) -> int:
-        """Get the offset from the start of the hive bins data."""
-        ...
+    offset: int
+    """The offset from the start of the hive bins data."""
     
-    @property
-    def size(self) -> int:
-        """Get the size of this hbin."""
-        ...
+    size: int
+    """The size of this hbin."""
     
     def __repr__(self) -> str: ...
 
@@ -167,6 +161,24 @@ class ValueData:
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
 
+class HiveBuffer:
+    """
+    Read-only buffer over the value data in a single cell of a hive.
+    
+    Backs the memoryview returned by RegistryValue.raw_buffer() and keeps
+    the hive data alive while the view exists.
+    """
+    
+    def __len__(self) -> int:
+        """
+        Get the data length in bytes.
+        
+        Raises:
+            IOError: If the cell can no longer be read
+            ValueError: If the cell is shorter than the value data
+        """
+        ...
+
 class RegistryValue:
     """
     Represents a registry value.
@@ -202,17 +214,58 @@ class RegistryValue:
         """
         ...
     
+    def raw_buffer(self) -> memoryview:
+        """
+        Get the raw value data as a read-only memoryview.
+        
+        Data stored in a single hive cell is exposed directly from the
+        (memory-mapped) hive without copying. Inline data and big data
+        blocks are copied into a bytes object first.
+        """
+        ...
+    
     def data_size(self) -> int:
         """Get the data size in bytes."""
         ...
     
     def __repr__(self) -> str: ...
 
+class SubkeyIter(Iterator[RegistryKey]):
+    """
+    Lazy iterator over the subkeys of a RegistryKey.
+    
+    Returned by RegistryKey.subkeys().
+    """
+    
+    def __iter__(self) -> SubkeyIter: ...
+    def __next__(self) -> RegistryKey: ...
+    def __length_hint__(self) -> int:
+        """Get the number of subkeys not yet yielded."""
+        ...
+
+class ValueIter(Iterator[RegistryValue]):
+    """
+    Lazy iterator over the values of a RegistryKey.
+    
+    Returned by RegistryKey.values().
+    """
+    
+    def __iter__(self) -> ValueIter: ...
+    def __next__(self) -> RegistryValue: ...
+    def __length_hint__(self) -> int:
+        """Get the number of values not yet yielded."""
+        ...
+
 class RegistryKey:
     """
     Represents a registry key.
     
     A key can contain subkeys and values. Keys form a hierarchical tree structure.
+    
+    A RegistryKey is a lightweight handle (the hive and the key's cell
+    offset); key data is read from the hive's key cache on access. Keys are
+    parsed when a handle is first created, so the accessors below only
+    raise if that cached data cannot be read.
     """
     
     def name(self) -> str:
@@ -220,20 +273,59 @@ class RegistryKey:
         Get the key name.
         
         Raises:
-            IOError: If there's an I/O error reading the name.
-            ValueError: If the name is invalid or corrupted.
+            IOError: If there's an I/O error reading the key.
+            ValueError: If the key data is invalid or corrupted.
+            RuntimeError: If the parser hits an internal error.
+        """
+        ...
+    
+    def offset(self) -> int:
+        """
+        Get the cell offset of this key.
+        
+        The offset identifies the key within its hive and can be passed to
+        ``Hive.key_at`` or ``Hive.walk``.
         """
         ...
     
     def subkey_count(self) -> int:
-        """Get the number of subkeys."""
+        """
+        Get the number of subkeys.
+        
+        Raises:
+            IOError: If there's an I/O error reading the key.
+            ValueError: If the key data is invalid or corrupted.
+            RuntimeError: If the parser hits an internal error.
+        """
         ...
     
     def value_count(self) -> int:
-        """Get the number of values."""
+        """
+        Get the number of values.
+        
+        Raises:
+            IOError: If there's an I/O error reading the key.
+            ValueError: If the key data is invalid or corrupted.
+            RuntimeError: If the parser hits an internal error.
+        """
+        ...
+    
+    def subkeys(self) -> SubkeyIter:
+        """
+        Iterate over subkeys.
+        
+        Subkeys are parsed one at a time as the iterator advances.
+        
+        Returns:
+            A SubkeyIter yielding RegistryKey objects.
+        
+        Raises:
+            IOError: If there's an I/O error reading the subkeys.
+            ValueError: If the subkey data is invalid or corrupted.
+        """
         ...
     
-    def subkeys(self) -> List[RegistryKey]:
+    def subkeys_list(self) -> List[RegistryKey]:
         """
         Get all subkeys.
         
@@ -246,7 +338,87 @@ class RegistryKey:
         """
         ...
     
-    def values(self) -> List[RegistryValue]:
+    def subkey_at(self, index: int) -> RegistryKey:
+        """
+        Get the subkey at a position, in the same order as subkeys().
+        
+        The subkey offsets are cached on first use, so positional access
+        is constant time.
+        
+        Args:
+            index: Zero-based position of the subkey.
+        
+        Returns:
+            The RegistryKey at that position.
+        
+        Raises:
+            IndexError: If index is out of range.
+            IOError: If there's an I/O error reading the subkey.
+            ValueError: If the subkey data is invalid or corrupted.
+        """
+        ...
+    
+    def find_subkeys(
+        self,
+        prefix: Optional[str] = None,
+        regex: Optional[str] = None,
+    ) -> List[RegistryKey]:
+        """
+        Get the subkeys whose names match a filter.
+        
+        Filtering happens in Rust, so RegistryKey objects are only created
+        for matching subkeys.
+        
+        Args:
+            prefix: Case-insensitive prefix the name must start with.
+            regex: Regular expression searched anywhere in the name
+                (case-sensitive unless it uses ``(?i)``).
+        
+        Returns:
+            A list of the matching subkeys, in on-disk order. A subkey must
+            match both filters when both are given.
+        
+        Raises:
+            IOError: If there's an I/O error reading the subkeys.
+            ValueError: If the regex is invalid or the subkey data is corrupted.
+        """
+        ...
+    
+    def subkey(self, name: str) -> RegistryKey:
+        """
+        Get a direct subkey by name (case-insensitive).
+        
+        The first lookup builds a search index over the key's subkeys;
+        later lookups only parse the matching candidates.
+        
+        Args:
+            name: The name of the subkey to retrieve.
+        
+        Returns:
+            The RegistryKey with the specified name.
+        
+        Raises:
+            IOError: If there's an I/O error reading the subkey.
+            ValueError: If the subkey is not found or data is corrupted.
+        """
+        ...
+    
+    def values(self) -> ValueIter:
+        """
+        Iterate over values.
+        
+        Values are parsed one at a time as the iterator advances.
+        
+        Returns:
+            A ValueIter yielding RegistryValue objects.
+        
+        Raises:
+            IOError: If there's an I/O error reading the values.
+            ValueError: If the value data is invalid or corrupted.
+        """
+        ...
+    
+    def values_list(self) -> List[RegistryValue]:
         """
         Get all values.
         
@@ -259,6 +431,26 @@ class RegistryKey:
         """
         ...
     
+    def value_at(self, index: int) -> RegistryValue:
+        """
+        Get the value at a position, in the same order as values().
+        
+        The value offsets are cached on first use, so positional access
+        is constant time.
+        
+        Args:
+            index: Zero-based position of the value.
+        
+        Returns:
+            The RegistryValue at that position.
+        
+        Raises:
+            IndexError: If index is out of range.
+            IOError: If there's an I/O error reading the value.
+            ValueError: If the value data is invalid or corrupted.
+        """
+        ...
+    
     def value(self, name: str) -> RegistryValue:
         """
         Get a specific value by name.
@@ -275,12 +467,37 @@ class RegistryKey:
         """
         ...
     
+    def walk(
+        self,
+        visitor: Optional[Callable[[List[Tuple[int, Optional[int], str]]], object]] = None,
+    ) -> Optional[List[Tuple[int, Optional[int], str]]]:
+        """
+        Visit this key and every key below it, walking subtrees in parallel.
+        
+        Equivalent to ``hive.walk(key.offset(), visitor)``; see ``Hive.walk``.
+        
+        Args:
+            visitor: If given, called with lists of up to 1024
+                ``(offset, parent_offset, name)`` tuples instead of
+                returning them.
+        
+        Returns:
+            A list of ``(offset, parent_offset, name)`` tuples, or None if a
+            visitor was given. ``parent_offset`` is None for this key.
+        """
+        ...
+    
     def last_written_timestamp(self) -> Optional[int]:
         """
         Get the last write timestamp as Unix timestamp (seconds since epoch).
         
         Returns:
             Unix timestamp in seconds, or None if not available.
+        
+        Raises:
+            IOError: If there's an I/O error reading the key.
+            ValueError: If the key data is invalid or corrupted.
+            RuntimeError: If the parser hits an internal error.
         """
         ...
     
@@ -359,6 +576,54 @@ class Hive:
         """
         ...
     
+    def key_at(self, offset: int) -> RegistryKey:
+        """
+        Get the key at a cell offset.
+        
+        Args:
+            offset: Cell offset of the key, as returned by
+                ``RegistryKey.offset()`` or ``walk``.
+        
+        Returns:
+            The RegistryKey at that offset.
+        
+        Raises:
+            IOError: If there's an I/O error reading the key.
+            ValueError: If there is no valid key at that offset.
+        """
+        ...
+    
+    def walk(
+        self,
+        root_offset: Optional[int] = None,
+        visitor: Optional[Callable[[List[Tuple[int, Optional[int], str]]], object]] = None,
+    ) -> Optional[List[Tuple[int, Optional[int], str]]]:
+        """
+        Visit every key under a key, walking subtrees in parallel.
+        
+        The walk runs on several threads without the GIL. Every key comes
+        after its parent in the results, and each tuple carries the offset
+        of its parent, so paths can be rebuilt from the results alone.
+        Offsets can be turned into keys with ``key_at``.
+        
+        Args:
+            root_offset: Cell offset of the key to start from. Defaults to
+                the root key.
+            visitor: If given, called with lists of up to 1024
+                ``(offset, parent_offset, name)`` tuples instead of
+                returning them.
+        
+        Returns:
+            A list of ``(offset, parent_offset, name)`` tuples, or None if a
+            visitor was given. ``parent_offset`` is None for the key the walk
+            started at.
+        
+        Raises:
+            IOError: If there's an I/O error reading a key.
+            ValueError: If key data is invalid or keys are nested too deeply.
+        """
+        ...
+    
     def hbins(self) -> List[HbinHeader]:
         """
         Get all hbin headers.
@@ -372,6 +637,26 @@ class Hive:
         """
         ...
     
+    def find_cells(self, signature: str) -> List[Tuple[int, int, bool]]:
+        """
+        Find every cell with a signature in all hbins.
+        
+        The hbin data is scanned directly instead of following key
+        references, so cells in free space (such as deleted keys) are found
+        too. An hbin with a damaged header is scanned without it.
+        
+        Args:
+            signature: Two-character cell signature, e.g. ``"nk"`` or ``"vk"``.
+        
+        Returns:
+            A list of ``(offset, size, is_allocated)`` tuples in hive order.
+            Key cells can be opened with ``key_at``.
+        
+        Raises:
+            ValueError: If the signature is not two bytes long.
+        """
+        ...
+    
     def save(self, path: str) -> None:
         """
         Save the hive to a file.
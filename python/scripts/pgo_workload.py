@@ -0,0 +1,76 @@
+"""
+Profile-guided optimization workload for the regrs Python bindings.
+
+Exercises the hot parsing paths (hive open, key traversal, value decoding,
+hbin iteration) against a directory of sample hives. The release workflow
+runs it with an instrumented build of regrs on a corpus generated by the
+test hive builder:
+
+    python python/tests/hive_builder.py pgo-corpus
+    python python/scripts/pgo_workload.py pgo-corpus
+"""
+
+import sys
+from pathlib import Path
+
+import regrs
+
+
+def walk(key):
+    """Recursively visit a key, reading every value's data."""
+    count = 1
+
+    for value in key.values():
+        value.name()
+        value.value_type()
+        try:
+            str(value.data())
+        except ValueError:
+            pass
+
+    for subkey in key.subkeys():
+        subkey.name()
+        count += walk(subkey)
+
+    return count
+
+
+def run(hive_dir):
+    """Parse every hive found in ``hive_dir``."""
+    total_keys = 0
+    hives = 0
+
+    for path in sorted(Path(hive_dir).iterdir()):
+        if not path.is_file() or path.suffix.upper() in (".LOG", ".LOG1", ".LOG2"):
+            continue
+
+        try:
+            hive = regrs.Hive.open(str(path))
+        except (IOError, ValueError):
+            continue
+
+        hive.base_block()
+        hive.hbins()
+        total_keys += walk(hive.root_key())
+        hives += 1
+
+        log1 = path.with_name(path.name + ".LOG1")
+        log2 = path.with_name(path.name + ".LOG2")
+        if log1.exists() or log2.exists():
+            logged = regrs.Hive.open_with_logs(
+                str(path),
+                str(log1) if log1.exists() else None,
+                str(log2) if log2.exists() else None,
+            )
+            total_keys += walk(logged.root_key())
+
+    print(f"Parsed {hives} hives, {total_keys} keys")
+    return hives
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(f"usage: {sys.argv[0]} HIVE_DIR")
+
+    if run(sys.argv[1]) == 0:
+        sys.exit("no registry hives found")
@@ -0,0 +1,22 @@
+"""
+Shared fixtures: a small sample hive written to a temporary file.
+"""
+
+import pytest
+import regrs
+
+from hive_builder import sample_hive
+
+
+@pytest.fixture
+def hive_path(tmp_path):
+    """Path of the sample hive, with one deleted key in its free space."""
+    path = tmp_path / "SAMPLE"
+    path.write_bytes(sample_hive(deleted=["Deleted"]))
+    return str(path)
+
+
+@pytest.fixture
+def hive(hive_path):
+    """The sample hive, opened."""
+    return regrs.Hive.open(hive_path)
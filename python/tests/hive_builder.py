@@ -0,0 +1,204 @@
+"""
+In-memory registry hive builder for the tests.
+
+Writes just enough of the hive format for the parser: a base block with a
+valid checksum, one hbin holding nk/vk/data cells, lh and ri subkey lists,
+and value lists. Run it as a script to write a larger sample hive, e.g. as
+a profiling corpus:
+
+    python python/tests/hive_builder.py OUT_DIR
+"""
+
+import struct
+import sys
+from pathlib import Path
+
+REG_SZ = 1
+REG_BINARY = 3
+REG_DWORD = 4
+
+BASE_BLOCK_SIZE = 0x1000
+HBIN_HEADER_SIZE = 0x20
+HBIN_ALIGNMENT = 0x1000
+NO_OFFSET = 0xFFFFFFFF
+
+
+def name_hash(name):
+    """``lh`` hash of a key name: ``hash * 37 + unit`` over upper-cased UTF-16."""
+    units = name.upper().encode("utf-16-le")
+    h = 0
+    for i in range(0, len(units), 2):
+        h = (h * 37 + int.from_bytes(units[i:i + 2], "little")) & 0xFFFFFFFF
+    return h
+
+
+def string_data(text):
+    """REG_SZ data: NUL-terminated UTF-16LE."""
+    return (text + "\0").encode("utf-16-le")
+
+
+def dword_data(number):
+    """REG_DWORD data."""
+    return struct.pack("<I", number)
+
+
+class Key:
+    """A key to write: a name, ``(name, type, data)`` values and subkeys."""
+
+    def __init__(self, name, values=(), subkeys=()):
+        self.name = name
+        self.values = list(values)
+        self.subkeys = list(subkeys)
+
+
+class HiveBuilder:
+    """
+    Lays out cells back to back in a single hbin.
+
+    Subkey lists longer than ``max_leaf`` are split into ``lh`` leaves under
+    an ``ri`` index root.
+    """
+
+    def __init__(self, max_leaf=64):
+        self.max_leaf = max_leaf
+        self._cells = bytearray()
+
+    def add_key(self, key, parent=0, deleted=False):
+        """Write ``key`` and everything below it; returns its cell offset."""
+        name = key.name.encode("ascii")
+        offset = self._alloc(bytes(0x4C) + name, free=deleted)
+
+        subkeys = sorted(key.subkeys, key=lambda subkey: subkey.name.upper())
+        children = [(self.add_key(subkey, offset), subkey.name) for subkey in subkeys]
+        values = [self.add_value(*value) for value in key.values]
+
+        subkey_list = self._subkey_list(children) if children else NO_OFFSET
+        value_list = self._alloc(struct.pack("<%dI" % len(values), *values)) if values else NO_OFFSET
+
+        nk = offset - HBIN_HEADER_SIZE + 4
+        self._cells[nk:nk + 4] = b"nk" + struct.pack("<H", 0x20)  # compressed (ASCII) name
+        struct.pack_into(
+            "<IIIIIIIII", self._cells, nk + 0x10,
+            parent, len(children), 0, subkey_list, NO_OFFSET,
+            len(values), value_list, NO_OFFSET, NO_OFFSET,
+        )
+        struct.pack_into("<H", self._cells, nk + 0x48, len(name))
+        return offset
+
+    def add_value(self, name, data_type, data):
+        """Write a value; data of up to 4 bytes is stored inline."""
+        if len(data) <= 4:
+            length = len(data) | 0x80000000
+            data_offset = int.from_bytes(data.ljust(4, b"\0"), "little")
+        else:
+            length = len(data)
+            data_offset = self._alloc(data)
+
+        name = name.encode("ascii")
+        flags = 1 if name else 0  # ASCII name
+        record = struct.pack("<2sHIIIHH", b"vk", len(name), length, data_offset, data_type, flags, 0)
+        return self._alloc(record + name)
+
+    def build(self, root):
+        """Return the hive bytes with ``root`` as the root key."""
+        root_offset = self.add_key(root)
+
+        used = HBIN_HEADER_SIZE + len(self._cells)
+        hbin_size = (used + HBIN_ALIGNMENT - 1) // HBIN_ALIGNMENT * HBIN_ALIGNMENT
+        hbin = bytearray(hbin_size)
+        hbin[0:4] = b"hbin"
+        struct.pack_into("<II", hbin, 0x04, 0, hbin_size)
+        hbin[HBIN_HEADER_SIZE:used] = self._cells
+        if used < hbin_size:
+            # Rest of the hbin is one free cell
+            struct.pack_into("<i", hbin, used, hbin_size - used)
+
+        header = bytearray(BASE_BLOCK_SIZE)
+        header[0:4] = b"regf"
+        struct.pack_into("<II", header, 0x04, 1, 1)
+        struct.pack_into("<IIIIIII", header, 0x14, 1, 5, 0, 1, root_offset, hbin_size, 1)
+        checksum = 0
+        for (dword,) in struct.iter_unpack("<I", header[:0x1FC]):
+            checksum ^= dword
+        struct.pack_into("<I", header, 0x1FC, checksum)
+
+        return bytes(header + hbin)
+
+    def _alloc(self, body, free=False):
+        """Append a cell (8-byte aligned); returns its cell offset."""
+        size = (len(body) + 4 + 7) // 8 * 8
+        offset = HBIN_HEADER_SIZE + len(self._cells)
+        self._cells += struct.pack("<i", size if free else -size)
+        self._cells += body + bytes(size - 4 - len(body))
+        return offset
+
+    def _subkey_list(self, children):
+        if len(children) <= self.max_leaf:
+            return self._lh(children)
+
+        leaves = [
+            self._lh(children[i:i + self.max_leaf])
+            for i in range(0, len(children), self.max_leaf)
+        ]
+        return self._alloc(b"ri" + struct.pack("<H%dI" % len(leaves), len(leaves), *leaves))
+
+    def _lh(self, children):
+        body = bytearray(b"lh" + struct.pack("<H", len(children)))
+        for offset, name in children:
+            body += struct.pack("<II", offset, name_hash(name))
+        return self._alloc(bytes(body))
+
+
+# Root subkeys of the sample hive, modelled on a SYSTEM hive
+SAMPLE_ROOT_SUBKEYS = ["ControlSet001", "ControlSet002", "Control", "MountedDevices", "Select", "Setup"]
+
+# Size of the REG_BINARY value on the sample root; large enough that
+# decoding it releases the GIL
+SAMPLE_BLOB_SIZE = 8000
+
+
+def sample_key(name, fanout, index=0):
+    """A key with a couple of values and ``fanout[0]`` subkeys per level."""
+    values = [
+        ("Name", REG_SZ, string_data(name)),
+        ("Index", REG_DWORD, dword_data(index)),
+    ]
+    subkeys = []
+    if fanout:
+        subkeys = [sample_key("Sub%d" % i, fanout[1:], i) for i in range(fanout[0])]
+    return Key(name, values, subkeys)
+
+
+def sample_hive(fanout=(3, 2), max_leaf=4, deleted=()):
+    """
+    Bytes of the sample hive.
+
+    The root key ``ROOT`` has a default REG_SZ value, a DWORD, a large
+    REG_BINARY and the ``SAMPLE_ROOT_SUBKEYS``, each with ``fanout``
+    levels of ``SubN`` keys below it. Keys named in ``deleted`` are written
+    as free nk cells that no list references.
+    """
+    root = Key(
+        "ROOT",
+        [
+            ("", REG_SZ, string_data("default")),
+            ("Answer", REG_DWORD, dword_data(42)),
+            ("Blob", REG_BINARY, bytes(i % 251 for i in range(SAMPLE_BLOB_SIZE))),
+        ],
+        [sample_key(name, fanout, i) for i, name in enumerate(SAMPLE_ROOT_SUBKEYS)],
+    )
+
+    builder = HiveBuilder(max_leaf)
+    for name in deleted:
+        builder.add_key(Key(name), deleted=True)
+    return builder.build(root)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: %s OUT_DIR" % sys.argv[0])
+
+    out_dir = Path(sys.argv[1])
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "SAMPLE").write_bytes(sample_hive(fanout=(20, 20, 5), max_leaf=64))
+    print("Wrote %s" % (out_dir / "SAMPLE"))
@@ -1,12 +1,19 @@
 """
-Basic tests for the reg_parser Python bindings.
+Basic tests for the regrs Python bindings.
 
 These tests verify the basic functionality of the Python bindings.
 """
 
+import ctypes
+import gc
+import struct
+import sys
+
 import pytest
 import regrs
 
+from hive_builder import REG_SZ, SAMPLE_BLOB_SIZE, SAMPLE_ROOT_SUBKEYS, sample_hive
+
 
 def test_version():
     """Test that version is available."""
@@ -20,6 +27,9 @@ def test_classes_available():
     assert hasattr(regrs, 'Hive')
     assert hasattr(regrs, 'RegistryKey')
     assert hasattr(regrs, 'RegistryValue')
+    assert hasattr(regrs, 'HiveBuffer')
+    assert hasattr(regrs, 'SubkeyIter')
+    assert hasattr(regrs, 'ValueIter')
     assert hasattr(regrs, 'ValueData')
     assert hasattr(regrs, 'ValueType')
     assert hasattr(regrs, 'BaseBlock')
@@ -42,90 +52,294 @@ def test_hive_open_with_logs_invalid():
         )
 
 
-# Note: The following tests require actual test data files
-# Uncomment and modify paths as needed when test data is available
-
-# def test_hive_open_valid():
-#     """Test opening a valid hive file."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     assert hive is not None
-#     assert isinstance(hive, regrs.Hive)
-
-
-# def test_base_block():
-#     """Test accessing base block information."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     base_block = hive.base_block()
-#     
-#     assert isinstance(base_block, regrs.BaseBlock)
-#     assert isinstance(base_block.signature, str)
-#     assert isinstance(base_block.primary_sequence, int)
-#     assert isinstance(base_block.secondary_sequence, int)
-#     assert isinstance(base_block.root_cell_offset, int)
-#     assert isinstance(base_block.hive_bins_data_size, int)
-
-
-# def test_root_key():
-#     """Test accessing the root key."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     root = hive.root_key()
-#     
-#     assert isinstance(root, regrs.RegistryKey)
-#     assert isinstance(root.name(), str)
-#     assert isinstance(root.subkey_count(), int)
-#     assert isinstance(root.value_count(), int)
-
-
-# def test_subkeys():
-#     """Test enumerating subkeys."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     root = hive.root_key()
-#     subkeys = root.subkeys()
-#     
-#     assert isinstance(subkeys, list)
-#     assert len(subkeys) > 0
-#     assert all(isinstance(k, regrs.RegistryKey) for k in subkeys)
-
-
-# def test_values():
-#     """Test enumerating values."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     root = hive.root_key()
-#     values = root.values()
-#     
-#     assert isinstance(values, list)
-#     assert all(isinstance(v, regrs.RegistryValue) for v in values)
-
-
-# def test_value_data():
-#     """Test accessing value data."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     root = hive.root_key()
-#     values = root.values()
-#     
-#     if values:
-#         value = values[0]
-#         assert isinstance(value.name(), str)
-#         assert isinstance(value.data_size(), int)
-#         
-#         data = value.data()
-#         assert isinstance(data, regrs.ValueData)
-
-
-# def test_hbins():
-#     """Test accessing hbin headers."""
-#     hive = regrs.Hive.open("test_data/SYSTEM")
-#     hbins = hive.hbins()
-#     
-#     assert isinstance(hbins, list)
-#     assert len(hbins) > 0
-#     assert all(isinstance(h, regrs.HbinHeader) for h in hbins)
-#     
-#     # Check first hbin
-#     hbin = hbins[0]
-#     assert isinstance(hbin.signature, str)
-#     assert isinstance(hbin.offset, int)
-#     assert isinstance(hbin.size, int)
+# The following tests run against the sample hive built by hive_builder:
+# ROOT with three values and six subkeys (split across an ri list), each
+# with two levels of SubN keys below it.
+
+def test_hive_open_valid(hive_path):
+    """Test opening a valid hive file."""
+    hive = regrs.Hive.open(hive_path)
+    assert hive is not None
+    assert isinstance(hive, regrs.Hive)
+
+
+def test_base_block(hive):
+    """Test accessing base block information."""
+    base_block = hive.base_block()
+    
+    assert isinstance(base_block, regrs.BaseBlock)
+    assert base_block.signature == "regf"
+    assert isinstance(base_block.primary_sequence, int)
+    assert isinstance(base_block.secondary_sequence, int)
+    assert base_block.root_cell_offset == hive.root_key().offset()
+    assert isinstance(base_block.hive_bins_data_size, int)
+    assert repr(base_block) == "BaseBlock(signature=regf, root_offset=%#x, hive_length=%#x)" % (
+        base_block.root_cell_offset, base_block.hive_length,
+    )
+
+
+def test_header_attributes_writable(hive):
+    """Header fields are plain attributes; changing one only changes that object."""
+    base_block = hive.base_block()
+    root_offset = base_block.root_cell_offset
+    
+    base_block.root_cell_offset = 0
+    assert base_block.root_cell_offset == 0
+    assert "root_offset=0x0," in repr(base_block)
+    assert hive.base_block().root_cell_offset == root_offset
+    assert hive.root_key().offset() == root_offset
+    
+    del base_block.file_name
+    with pytest.raises(AttributeError):
+        base_block.file_name
+    
+    hbin = hive.hbins()[0]
+    hbin.size = "unknown"
+    assert repr(hbin) == "HbinHeader(offset=0x0, size='unknown')"
+    assert hive.hbins()[0].size % 0x1000 == 0
+
+
+def test_root_key(hive):
+    """Test accessing the root key."""
+    root = hive.root_key()
+    
+    assert isinstance(root, regrs.RegistryKey)
+    assert root.name() == "ROOT"
+    # Names come from the hive's name cache
+    assert root.name() is hive.root_key().name()
+    assert root.subkey_count() == len(SAMPLE_ROOT_SUBKEYS)
+    assert root.value_count() == 3
+    assert repr(root) == "RegistryKey(name='ROOT', subkeys=6, values=3)"
+
+
+def test_subkeys(hive):
+    """Test enumerating subkeys."""
+    root = hive.root_key()
+    subkeys = root.subkeys()
+    
+    assert isinstance(subkeys, regrs.SubkeyIter)
+    assert subkeys.__length_hint__() == len(SAMPLE_ROOT_SUBKEYS)
+    subkeys = list(subkeys)
+    assert all(isinstance(k, regrs.RegistryKey) for k in subkeys)
+    assert [k.name() for k in subkeys] == sorted(SAMPLE_ROOT_SUBKEYS, key=str.upper)
+    assert [k.offset() for k in root.subkeys_list()] == [k.offset() for k in subkeys]
+    for index, subkey in enumerate(subkeys):
+        assert root.subkey_at(index).offset() == subkey.offset()
+    with pytest.raises(IndexError):
+        root.subkey_at(len(subkeys))
+
+
+def test_subkey(hive):
+    """Test looking up subkeys by name."""
+    root = hive.root_key()
+    
+    key = root.subkey("controlset002")
+    assert key.name() == "ControlSet002"
+    assert key.subkey("SUB1").name() == "Sub1"
+    with pytest.raises(ValueError):
+        root.subkey("Missing")
+
+
+def test_find_subkeys(hive):
+    """Test filtering subkeys by name."""
+    root = hive.root_key()
+    names = [k.name() for k in root.subkeys()]
+    
+    assert len(root.find_subkeys()) == len(names)
+    found = root.find_subkeys(prefix="control")
+    assert [k.name() for k in found] == ["Control", "ControlSet001", "ControlSet002"]
+    found = root.find_subkeys(regex=r"^ControlSet\d+$")
+    assert [k.name() for k in found] == ["ControlSet001", "ControlSet002"]
+    found = root.find_subkeys(prefix="control", regex="1$")
+    assert [k.name() for k in found] == ["ControlSet001"]
+    with pytest.raises(ValueError):
+        root.find_subkeys(regex="(")
+
+
+def test_walk(hive):
+    """Test walking the key tree."""
+    root = hive.root_key()
+    keys = hive.walk()
+    
+    assert keys[0] == (root.offset(), None, root.name())
+    assert len(keys) == 1 + len(SAMPLE_ROOT_SUBKEYS) * (1 + 3 + 3 * 2)
+    assert root.walk() == keys
+    
+    # Parents come first, so paths can be rebuilt in one pass
+    paths = {}
+    for offset, parent, name in keys:
+        paths[offset] = name if parent is None else paths[parent] + "\\" + name
+        assert hive.key_at(offset).name() == name
+    assert "ROOT\\ControlSet001\\Sub2\\Sub1" in paths.values()
+    
+    batches = []
+    assert hive.walk(visitor=batches.append) is None
+    assert all(len(batch) <= 1024 for batch in batches)
+    assert [key for batch in batches for key in batch] == keys
+    
+    setup = root.subkey("Setup")
+    assert hive.walk(setup.offset()) == setup.walk()
+    assert setup.walk()[0] == (setup.offset(), None, "Setup")
+
+
+def test_values(hive):
+    """Test enumerating values."""
+    root = hive.root_key()
+    values = root.values()
+    
+    assert isinstance(values, regrs.ValueIter)
+    assert values.__length_hint__() == 3
+    values = list(values)
+    assert all(isinstance(v, regrs.RegistryValue) for v in values)
+    assert [v.name() for v in values] == ["(default)", "Answer", "Blob"]
+    assert [v.name() for v in root.values_list()] == [v.name() for v in values]
+    assert root.value_at(1).name() == "Answer"
+    with pytest.raises(IndexError):
+        root.value_at(3)
+
+
+def test_value_data(hive):
+    """Test accessing value data."""
+    root = hive.root_key()
+    
+    default = root.value("(default)")
+    assert default.value_type().type_id() == REG_SZ
+    assert default.data().as_string() == "default"
+    
+    answer = root.value("answer")
+    assert answer.data_size() == 4
+    assert answer.data().as_dword() == 42
+    assert answer.raw_data() == struct.pack("<I", 42)
+    
+    # Large enough to be decoded without the GIL
+    blob = root.value("Blob")
+    blob_data = bytes(i % 251 for i in range(SAMPLE_BLOB_SIZE))
+    assert blob.data_size() == SAMPLE_BLOB_SIZE
+    assert blob.data().is_binary()
+    assert blob.data().as_binary() == blob_data
+    assert blob.raw_data() == blob_data
+    
+    with pytest.raises(ValueError):
+        root.value("Missing")
+
+
+class Py_buffer(ctypes.Structure):
+    """The C ``Py_buffer`` struct, for requesting buffers with explicit flags."""
+    
+    _fields_ = [
+        ("buf", ctypes.c_void_p),
+        ("obj", ctypes.c_void_p),
+        ("len", ctypes.c_ssize_t),
+        ("itemsize", ctypes.c_ssize_t),
+        ("readonly", ctypes.c_int),
+        ("ndim", ctypes.c_int),
+        ("format", ctypes.c_char_p),
+        ("shape", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("strides", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("suboffsets", ctypes.POINTER(ctypes.c_ssize_t)),
+        ("internal", ctypes.c_void_p),
+    ]
+
+
+PyBUF_SIMPLE = 0
+PyBUF_WRITABLE = 0x0001
+
+PyObject_GetBuffer = ctypes.PYFUNCTYPE(
+    ctypes.c_int, ctypes.py_object, ctypes.POINTER(Py_buffer), ctypes.c_int
+)(("PyObject_GetBuffer", ctypes.pythonapi))
+PyBuffer_Release = ctypes.PYFUNCTYPE(
+    None, ctypes.POINTER(Py_buffer)
+)(("PyBuffer_Release", ctypes.pythonapi))
+
+
+def test_raw_buffer(hive_path):
+    """Test the zero-copy buffer over cell data."""
+    hive = regrs.Hive.open(hive_path)
+    blob = hive.root_key().value("Blob")
+    raw = blob.raw_data()
+    assert len(raw) == SAMPLE_BLOB_SIZE
+    
+    view = blob.raw_buffer()
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert (view.format, view.itemsize, view.ndim) == ("B", 1, 1)
+    assert view.shape == (len(raw),)
+    assert view.strides == (1,)
+    assert bytes(view) == raw
+    with pytest.raises(TypeError):
+        view[0] = 0
+    
+    buffer = view.obj
+    assert isinstance(buffer, regrs.HiveBuffer)
+    assert len(buffer) == len(raw)
+    
+    # Simple requests get no format/shape/strides; each view holds a
+    # reference to the buffer until it is released
+    refs = sys.getrefcount(buffer)
+    simple = Py_buffer()
+    PyObject_GetBuffer(buffer, ctypes.byref(simple), PyBUF_SIMPLE)
+    assert sys.getrefcount(buffer) == refs + 1
+    assert (simple.len, simple.readonly, simple.ndim) == (len(raw), 1, 1)
+    assert simple.format is None
+    assert not simple.shape and not simple.strides
+    assert ctypes.string_at(simple.buf, simple.len) == raw
+    PyBuffer_Release(ctypes.byref(simple))
+    assert sys.getrefcount(buffer) == refs
+    
+    with pytest.raises(BufferError):
+        PyObject_GetBuffer(buffer, ctypes.byref(Py_buffer()), PyBUF_WRITABLE)
+    assert sys.getrefcount(buffer) == refs
+    
+    # The view keeps the hive data alive
+    del hive, blob, buffer
+    gc.collect()
+    assert bytes(view) == raw
+    
+    # Inline data is copied into bytes
+    answer = regrs.Hive.open(hive_path).root_key().value("Answer")
+    assert answer.raw_buffer().obj == struct.pack("<I", 42)
+
+
+def test_find_cells(hive):
+    """Test scanning hbins for cells."""
+    cells = hive.find_cells("nk")
+    
+    assert all(size % 8 == 0 for _, size, _ in cells)
+    allocated = [offset for offset, _, is_allocated in cells if is_allocated]
+    assert sorted(allocated) == sorted(offset for offset, _, _ in hive.walk())
+    deleted = [offset for offset, _, is_allocated in cells if not is_allocated]
+    assert [hive.key_at(offset).name() for offset in deleted] == ["Deleted"]
+    
+    assert len(hive.find_cells("ri")) == 1
+    with pytest.raises(ValueError):
+        hive.find_cells("nkx")
+
+
+def test_find_cells_damaged_hbin(tmp_path):
+    """Test that a damaged hbin header does not stop the scan."""
+    data = bytearray(sample_hive())
+    data[0x1000:0x1004] = b"XXXX"
+    path = tmp_path / "DAMAGED"
+    path.write_bytes(bytes(data))
+    
+    hive = regrs.Hive.open(str(path))
+    assert hive.hbins() == []
+    assert len(hive.find_cells("nk")) == len(hive.walk())
+
+
+def test_hbins(hive):
+    """Test accessing hbin headers."""
+    hbins = hive.hbins()
+    
+    assert isinstance(hbins, list)
+    assert len(hbins) == 1
+    assert all(isinstance(h, regrs.HbinHeader) for h in hbins)
+    
+    # Check first hbin
+    hbin = hbins[0]
+    assert hbin.signature == "hbin"
+    assert hbin.offset == 0
+    assert hbin.size % 0x1000 == 0
 
 
 if __name__ == "__main__":
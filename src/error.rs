@@ -19,7 +19,9 @@ pub enum RegistryError {
     /// Invalid magic signature in header or structure.
     #[error("Invalid signature: expected {expected:?}, found {found:?}")]
     InvalidSignature {
+        /// Expected signature
         expected: Vec<u8>,
+        /// Signature found in the data
         found: Vec<u8>,
     },
 
@@ -30,21 +32,27 @@ pub enum RegistryError {
     /// Cell offset is out of bounds.
     #[error("Invalid cell offset: {offset:#x} (hive size: {hive_size:#x})")]
     InvalidOffset {
+        /// Offending cell offset
         offset: u32,
+        /// Size of the hive data
         hive_size: usize,
     },
 
     /// Cell size is invalid or corrupted.
     #[error("Invalid cell size: {size} at offset {offset:#x}")]
     InvalidCellSize {
+        /// Raw cell size field
         size: i32,
+        /// Cell offset
         offset: u32,
     },
 
     /// Unknown or unsupported cell type.
     #[error("Unknown cell type: {cell_type:?} at offset {offset:#x}")]
     UnknownCellType {
+        /// Cell signature found
         cell_type: [u8; 2],
+        /// Cell offset
         offset: u32,
     },
 
@@ -55,6 +63,7 @@ pub enum RegistryError {
     /// Invalid UTF-16 string data.
     #[error("Invalid UTF-16 string at offset {offset:#x}")]
     InvalidUtf16 {
+        /// Offset of the string
         offset: u32,
     },
 
@@ -65,35 +74,45 @@ pub enum RegistryError {
     /// Hive is too small to be valid.
     #[error("Hive too small: {size} bytes (minimum: {minimum} bytes)")]
     HiveTooSmall {
+        /// Size of the hive data
         size: usize,
+        /// Minimum valid size
         minimum: usize,
     },
 
     /// Checksum mismatch in hive header.
     #[error("Checksum mismatch: expected {expected:#x}, calculated {calculated:#x}")]
     ChecksumMismatch {
+        /// Checksum stored in the header
         expected: u32,
+        /// Checksum calculated from the header
         calculated: u32,
     },
 
     /// Unsupported hive version.
     #[error("Unsupported hive version: {major}.{minor}")]
     UnsupportedVersion {
+        /// Major version
         major: u32,
+        /// Minor version
         minor: u32,
     },
 
     /// Data truncated or incomplete.
     #[error("Truncated data at offset {offset:#x}: expected {expected} bytes, got {actual} bytes")]
     TruncatedData {
+        /// Offset of the data
         offset: u32,
+        /// Number of bytes needed
         expected: usize,
+        /// Number of bytes available
         actual: usize,
     },
 
     /// Invalid subkey list type.
     #[error("Invalid subkey list type: {list_type:?}")]
     InvalidSubkeyList {
+        /// Subkey list signature found
         list_type: [u8; 2],
     },
 
@@ -150,7 +169,7 @@ impl RegistryError {
     /// # Examples
     ///
     /// ```rust
-    /// # use reg_parser::error::RegistryError;
+    /// # use regrs::error::RegistryError;
     /// let len = 256;
     /// let offset = 0x1000;
     /// let err = RegistryError::format_error(
@@ -171,7 +190,7 @@ impl RegistryError {
     /// # Examples
     ///
     /// ```rust
-    /// # use reg_parser::error::RegistryError;
+    /// # use regrs::error::RegistryError;
     /// let err = RegistryError::not_found("value", "DisplayName");
     /// ```
     pub fn not_found(item_type: &str, name: &str) -> Self {
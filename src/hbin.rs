@@ -5,6 +5,7 @@
 
 use crate::error::{RegistryError, Result};
 use crate::utils::read_u32_le;
+use memchr::memmem;
 
 /// Expected signature for hive bins ("hbin").
 pub const HBIN_SIGNATURE: &[u8; 4] = b"hbin";
@@ -12,6 +13,16 @@ pub const HBIN_SIGNATURE: &[u8; 4] = b"hbin";
 /// Minimum size of an hbin header.
 pub const HBIN_HEADER_SIZE: usize = 0x20;
 
+/// Hbins start on, and are sized in multiples of, 4KB boundaries.
+pub const HBIN_ALIGNMENT: usize = 0x1000;
+
+/// Cells are aligned to 8 bytes within an hbin.
+const CELL_ALIGNMENT: usize = 8;
+
+/// Data areas at least this large are scanned with SIMD `memmem`; smaller
+/// ones are cheaper to probe at each aligned cell position directly.
+const SIMD_SCAN_MIN_SIZE: usize = 4096;
+
 /// Hive bin header structure.
 ///
 /// Each hbin contains a header followed by registry cells. Hbins are always
@@ -184,6 +195,55 @@ impl<'a> Iterator for HbinCellIterator<'a> {
     }
 }
 
+/// Finds cells with the given signature anywhere in an hbin's data area.
+///
+/// Unlike [`HbinCellIterator`], this does not follow the chain of cell
+/// sizes, so it also finds cells in free space and in hbins whose chain is
+/// damaged. A match counts as a cell only if the signature sits right after
+/// an 8-byte aligned size field and that size fits inside `data`.
+///
+/// # Arguments
+///
+/// * `data` - The hbin's data area (excluding header).
+/// * `data_offset` - Cell offset of the first byte of `data`.
+/// * `signature` - Cell signature to look for (e.g. `b"nk"`).
+pub fn find_cells<'a>(data: &'a [u8], data_offset: u32, signature: &[u8; 2]) -> Vec<CellInfo<'a>> {
+    let to_cell = |signature_pos: usize| {
+        signature_pos
+            .checked_sub(4)
+            .filter(|start| start % CELL_ALIGNMENT == 0)
+            .and_then(|start| cell_at(data, start, data_offset))
+    };
+    
+    if data.len() >= SIMD_SCAN_MIN_SIZE {
+        memmem::find_iter(data, signature).filter_map(to_cell).collect()
+    } else {
+        (4..data.len().saturating_sub(1))
+            .step_by(CELL_ALIGNMENT)
+            .filter(|&pos| data[pos..pos + 2] == signature[..])
+            .filter_map(to_cell)
+            .collect()
+    }
+}
+
+/// Reads the cell starting at `start` in an hbin data area, if its size
+/// field is plausible.
+fn cell_at(data: &[u8], start: usize, data_offset: u32) -> Option<CellInfo<'_>> {
+    let size = read_u32_le(data, start).ok()? as i32;
+    let abs_size = size.unsigned_abs() as usize;
+    
+    if abs_size < CELL_ALIGNMENT || abs_size % CELL_ALIGNMENT != 0 || abs_size > data.len() - start {
+        return None;
+    }
+    
+    Some(CellInfo {
+        offset: data_offset + start as u32,
+        size: abs_size as u32,
+        is_allocated: size < 0,
+        data: &data[start + 4..start + abs_size],
+    })
+}
+
 /// Information about a cell within an hbin.
 #[derive(Debug)]
 pub struct CellInfo<'a> {
@@ -228,4 +288,32 @@ mod tests {
         let result = HbinHeader::parse(&data, 0);
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_find_cells() {
+        for len in [256, SIMD_SCAN_MIN_SIZE * 2] {
+            let mut data = vec![0u8; len];
+            
+            // Allocated nk cell at 0x10
+            data[0x10..0x14].copy_from_slice(&(-0x20i32).to_le_bytes());
+            data[0x14..0x16].copy_from_slice(b"nk");
+            // Free nk cell at 0x40
+            data[0x40..0x44].copy_from_slice(&0x18i32.to_le_bytes());
+            data[0x44..0x46].copy_from_slice(b"nk");
+            // Misaligned signature inside other data
+            data[0x61..0x63].copy_from_slice(b"nk");
+            // Size running past the end of the data
+            data[0x80..0x84].copy_from_slice(&(-(len as i32)).to_le_bytes());
+            data[0x84..0x86].copy_from_slice(b"nk");
+            
+            let cells = find_cells(&data, 0x20, b"nk");
+            assert_eq!(cells.len(), 2, "data length {}", len);
+            assert_eq!(cells[0].offset, 0x30);
+            assert!(cells[0].is_allocated);
+            assert_eq!(cells[0].data.len(), 0x1C);
+            assert_eq!(cells[1].offset, 0x60);
+            assert!(!cells[1].is_allocated);
+            assert_eq!(cells[1].cell_type(), Some(*b"nk"));
+        }
+    }
 }
@@ -116,11 +116,11 @@ impl BaseBlock {
         let clustering_factor = read_u32_le(data, 0x2C)?;
         
         // File name at offset 0x30 (64 UTF-16LE characters = 128 bytes)
-        let file_name_bytes = &data[0x30..0xB0];
+        let file_name_bytes = &data[FILE_NAME_OFFSET..FILE_NAME_OFFSET + FILE_NAME_LENGTH];
         let file_name = read_fixed_ascii(file_name_bytes, 64);
         
         // Checksum at offset 0x1FC
-        let checksum = read_u32_le(data, 0x1FC)?;
+        let checksum = read_u32_le(data, CHECKSUM_OFFSET)?;
 
         // Verify checksum
         let calculated = calculate_checksum(data);
@@ -132,7 +132,7 @@ impl BaseBlock {
         }
 
         // Verify version (support 1.3, 1.4, 1.5, 1.6)
-        if major_version != 1 || minor_version < 3 || minor_version > 6 {
+        if major_version != 1 || !(3..=6).contains(&minor_version) {
             return Err(RegistryError::UnsupportedVersion {
                 major: major_version,
                 minor: minor_version,
@@ -2,21 +2,37 @@
 
 use crate::bigdata::BigDataBlock;
 use crate::error::{RegistryError, Result};
-use crate::hbin::HbinHeader;
+use crate::hbin::{find_cells, CellInfo, HbinHeader, HBIN_ALIGNMENT, HBIN_HEADER_SIZE};
 use crate::header::{BaseBlock, BASE_BLOCK_SIZE};
 use crate::key::KeyNode;
-use crate::subkey_list::SubkeyList;
-use crate::transaction_log::{TransactionLog, merge_transaction_logs};
+use crate::subkey_list::{name_hash, SubkeyIndex, SubkeyList};
+use crate::transaction_log::{TransactionLog, apply_transaction_logs, load_transaction_logs};
 use crate::utils::{cell_offset_to_absolute, calculate_checksum};
 use crate::value::{ValueData, ValueKey};
 use memmap2::Mmap;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet, VecDeque};
 use std::fs::File;
 use std::io::Write;
 use std::path::Path;
-use std::sync::{Arc, RwLock};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::{Arc, OnceLock, RwLock};
+use std::thread;
 use tracing::{debug, info, warn, instrument};
 
+/// Maximum size for direct cell storage (before big data blocks are used).
+const MAX_DIRECT_DATA_SIZE: u32 = 16344;
+
+/// Maximum key nesting depth allowed by Windows.
+const MAX_KEY_DEPTH: usize = 512;
+
+/// Subtrees per thread that a parallel walk aims for, so threads that
+/// finish early can pick up more work.
+const WALK_SUBTREES_PER_THREAD: usize = 4;
+
+/// Key nodes a walker parses before publishing them to the key cache in
+/// one write lock.
+const WALK_CACHE_BATCH_SIZE: usize = 256;
+
 /// Main registry hive parser.
 ///
 /// This structure provides access to a Windows registry hive file using
@@ -37,6 +53,23 @@ pub struct Hive {
     /// Cache of parsed key nodes (offset -> KeyNode).
     /// Uses RwLock for interior mutability to allow thread-safe caching with &self.
     key_cache: RwLock<HashMap<u32, KeyNode>>,
+    
+    /// Lazily built lookup data of keys that were enumerated or searched
+    /// (offset -> KeyExtras). Kept beside the key cache so parsing and
+    /// cloning key nodes stays allocation free.
+    key_extras: RwLock<HashMap<u32, Arc<KeyExtras>>>,
+}
+
+/// Per-key lookup data that is only built when a key is enumerated or
+/// searched by name.
+#[derive(Default)]
+struct KeyExtras {
+    /// Subkey search index, built on first lookup by name.
+    subkey_index: OnceLock<SubkeyIndex>,
+    /// Cell offsets of all subkeys in list order, collected on first use.
+    subkey_offsets: OnceLock<Vec<u32>>,
+    /// Cell offsets of all values in list order, collected on first use.
+    value_offsets: OnceLock<Vec<u32>>,
 }
 
 /// Represents hive data storage.
@@ -56,11 +89,6 @@ impl HiveData {
         }
     }
 
-    /// Returns the length of the hive data.
-    fn len(&self) -> usize {
-        self.as_slice().len()
-    }
-
     /// Converts to a Vec<u8>.
     fn to_vec(&self) -> Vec<u8> {
         self.as_slice().to_vec()
@@ -84,13 +112,24 @@ impl Hive {
     /// # Examples
     ///
     /// ```no_run
-    /// use reg_parser::Hive;
+    /// use regrs::Hive;
     ///
     /// let hive = Hive::open("SYSTEM").unwrap();
     /// ```
     #[instrument(skip(path), fields(path = %path.as_ref().display()))]
     pub fn open<P: AsRef<Path>>(path: P) -> Result<Self> {
         info!("Opening registry hive");
+        let mmap = Self::map_file(path)?;
+        
+        Self::from_data(HiveData::Mapped(mmap))
+    }
+
+    /// Memory-maps a hive file after validating its size.
+    ///
+    /// # Arguments
+    ///
+    /// * `path` - Path to the registry hive file.
+    fn map_file<P: AsRef<Path>>(path: P) -> Result<Mmap> {
         let file = File::open(&path)?;
         debug!("File opened successfully");
         
@@ -117,7 +156,7 @@ impl Hive {
         let mmap = unsafe { Mmap::map(&file)? };
         debug!(size = mmap.len(), "Memory mapped hive file");
         
-        Self::from_data(HiveData::Mapped(mmap))
+        Ok(mmap)
     }
 
     /// Creates a hive parser from a memory-mapped region.
@@ -147,6 +186,7 @@ impl Hive {
             data,
             base_block,
             key_cache: RwLock::new(HashMap::new()),
+            key_extras: RwLock::new(HashMap::new()),
         })
     }
 
@@ -161,7 +201,7 @@ impl Hive {
     ///
     /// Returns an error if the root key cannot be parsed.
     #[instrument(skip(self))]
-    pub fn root_key(&self) -> Result<RegistryKey> {
+    pub fn root_key(&self) -> Result<RegistryKey<'_>> {
         debug!(offset = %format!("{:#x}", self.base_block.root_cell_offset), "Accessing root key");
         let offset = self.base_block.root_cell_offset;
         self.get_key(offset)
@@ -177,7 +217,7 @@ impl Hive {
     ///
     /// This method uses an internal cache to avoid re-parsing the same key node
     /// multiple times during traversal. The cache is transparent to the caller.
-    pub fn get_key(&self, offset: u32) -> Result<RegistryKey> {
+    pub fn get_key(&self, offset: u32) -> Result<RegistryKey<'_>> {
         // Check cache first (read lock)
         if let Some(key_node) = self.key_cache.read()
             .expect("key cache lock poisoned")
@@ -188,20 +228,117 @@ impl Hive {
                 hive: self,
                 offset,
                 key_node: key_node.clone(),
+                extras: OnceLock::new(),
             });
         }
         
         // Parse and cache (write lock)
         debug!(offset = %format!("{:#x}", offset), "Cache miss, parsing key node");
         let key_node = self.parse_key_node(offset)?;
-        self.key_cache.write()
+        // Another thread may have cached the node meanwhile; keep its entry
+        let key_node = self.key_cache.write()
             .expect("key cache lock poisoned")
-            .insert(offset, key_node.clone());
+            .entry(offset)
+            .or_insert(key_node)
+            .clone();
         
         Ok(RegistryKey {
             hive: self,
             offset,
             key_node,
+            extras: OnceLock::new(),
+        })
+    }
+
+    /// Runs `f` on the key node at `offset` without cloning it.
+    ///
+    /// The node is read from the key cache, or parsed and cached on a miss,
+    /// exactly like [`Hive::get_key`]. `f` runs while the cache is locked, so
+    /// it must not call back into the hive.
+    ///
+    /// # Arguments
+    ///
+    /// * `offset` - Cell offset (relative to first hbin).
+    /// * `f` - Function to run on the key node.
+    pub fn with_key_node<R>(&self, offset: u32, f: impl FnOnce(&KeyNode) -> R) -> Result<R> {
+        if let Some(key_node) = self.key_cache.read()
+            .expect("key cache lock poisoned")
+            .get(&offset)
+        {
+            return Ok(f(key_node));
+        }
+        
+        let key_node = self.parse_key_node(offset)?;
+        let mut cache = self.key_cache.write().expect("key cache lock poisoned");
+        Ok(f(cache.entry(offset).or_insert(key_node)))
+    }
+
+    /// Gets several key nodes by their cell offsets in one batch.
+    ///
+    /// Keys are returned in the same order as `offsets`. The key cache is
+    /// locked once for reading and once for writing for the whole batch, and
+    /// uncached cells are parsed in ascending offset order so the hive data
+    /// is walked front to back instead of hopping between pages.
+    ///
+    /// # Arguments
+    ///
+    /// * `offsets` - Cell offsets (relative to first hbin).
+    pub fn get_keys(&self, offsets: &[u32]) -> Result<Vec<RegistryKey<'_>>> {
+        let mut key_nodes: Vec<Option<KeyNode>> = Vec::with_capacity(offsets.len());
+        let mut misses = Vec::new();
+
+        // Serve what we can from the cache (single read lock)
+        {
+            let cache = self.key_cache.read().expect("key cache lock poisoned");
+            for (index, offset) in offsets.iter().enumerate() {
+                let cached = cache.get(offset).cloned();
+                if cached.is_none() {
+                    misses.push((*offset, index));
+                }
+                key_nodes.push(cached);
+            }
+        }
+
+        if !misses.is_empty() {
+            debug!(count = misses.len(), "Cache misses, parsing key nodes in batch");
+            misses.sort_unstable();
+
+            let mut parsed = Vec::with_capacity(misses.len());
+            for &(offset, index) in &misses {
+                parsed.push((offset, index, self.parse_key_node(offset)?));
+            }
+
+            // Publish the new entries (single write lock). Nodes another
+            // thread cached in the meantime win, so every caller sees the
+            // same entry.
+            let mut cache = self.key_cache.write().expect("key cache lock poisoned");
+            for (offset, index, key_node) in parsed {
+                key_nodes[index] = Some(cache.entry(offset).or_insert(key_node).clone());
+            }
+        }
+
+        Ok(offsets
+            .iter()
+            .zip(key_nodes)
+            .map(|(&offset, key_node)| RegistryKey {
+                hive: self,
+                offset,
+                key_node: key_node.expect("every key node is cached or parsed"),
+                extras: OnceLock::new(),
+            })
+            .collect())
+    }
+
+    /// Gets a value by its cell offset.
+    ///
+    /// # Arguments
+    ///
+    /// * `offset` - Cell offset of the value key (relative to first hbin).
+    pub fn get_value(&self, offset: u32) -> Result<RegistryValue<'_>> {
+        let value_key = self.parse_value_key(offset)?;
+        Ok(RegistryValue {
+            hive: self,
+            value_key,
         })
     }
 
@@ -211,8 +348,27 @@ impl Hive {
         KeyNode::parse(cell_data, offset)
     }
 
+    /// Returns the lazily built lookup data of the key at `offset`,
+    /// allocating an empty entry on first use.
+    fn key_extras(&self, offset: u32) -> Arc<KeyExtras> {
+        if let Some(extras) = self.key_extras.read()
+            .expect("key extras lock poisoned")
+            .get(&offset)
+        {
+            return Arc::clone(extras);
+        }
+        
+        Arc::clone(self.key_extras.write()
+            .expect("key extras lock poisoned")
+            .entry(offset)
+            .or_default())
+    }
+
     /// Reads a cell at the given offset.
     ///
+    /// The returned slice borrows directly from the hive data; nothing is
+    /// copied.
+    ///
     /// # Arguments
     ///
     /// * `offset` - Cell offset (relative to first hbin).
@@ -220,7 +376,7 @@ impl Hive {
     /// # Returns
     ///
     /// Returns the cell data (excluding the size field).
-    fn read_cell(&self, offset: u32) -> Result<&[u8]> {
+    pub fn read_cell(&self, offset: u32) -> Result<&[u8]> {
         let abs_offset = cell_offset_to_absolute(offset)? as usize;
         let data = self.data.as_slice();
         
@@ -260,6 +416,24 @@ impl Hive {
         Ok(&data[data_start..data_end])
     }
 
+    /// Reads the first `length` bytes of the cell at the given offset.
+    ///
+    /// Cells are padded to 8-byte alignment, so value data stored in a cell
+    /// is usually shorter than the cell; this returns just the data.
+    ///
+    /// # Errors
+    ///
+    /// Returns `RegistryError::TruncatedData` if the cell is shorter than
+    /// `length`.
+    pub fn read_cell_data(&self, offset: u32, length: usize) -> Result<&[u8]> {
+        let cell_data = self.read_cell(offset)?;
+        cell_data.get(..length).ok_or(RegistryError::TruncatedData {
+            offset,
+            expected: length,
+            actual: cell_data.len(),
+        })
+    }
+
     /// Parses a subkey list at the given offset.
     fn parse_subkey_list(&self, offset: u32) -> Result<SubkeyList> {
         let cell_data = self.read_cell(offset)?;
@@ -290,16 +464,13 @@ impl Hive {
             return Ok(Vec::new());
         }
 
-        // Maximum size for direct cell storage (before big data blocks are used)
-        const MAX_DIRECT_DATA_SIZE: u32 = 16344;
-
         // For large data (>16344 bytes), data is stored in a db structure
         if length > MAX_DIRECT_DATA_SIZE {
             return self.read_big_data(offset, length);
         }
 
-        // Regular data - read directly from cell
-        Ok(self.read_cell(offset)?.to_vec())
+        // Regular data - read directly from cell, without its padding
+        Ok(self.read_cell_data(offset, length as usize)?.to_vec())
     }
     
     /// Reads big data block (values > 16KB).
@@ -377,7 +548,7 @@ impl Hive {
     }
 
     /// Iterates over all hbins in the hive.
-    pub fn hbins(&self) -> HbinIterator {
+    pub fn hbins(&self) -> HbinIterator<'_> {
         let data = self.data.as_slice();
         HbinIterator {
             data: &data[BASE_BLOCK_SIZE..],
@@ -385,6 +556,211 @@ impl Hive {
         }
     }
 
+    /// Finds every cell with the given signature in all hbins.
+    ///
+    /// The hbins are scanned byte by byte (with SIMD for large hbins)
+    /// instead of following cell chains and key references, so cells in
+    /// free space, such as deleted keys, are found too. See
+    /// [`hbin::find_cells`](crate::hbin::find_cells) for how matches are
+    /// validated.
+    ///
+    /// An hbin whose header is damaged is logged and scanned without it:
+    /// everything up to the next valid hbin header is searched as one data
+    /// area, so cells survive a broken hbin chain.
+    ///
+    /// # Arguments
+    ///
+    /// * `signature` - Cell signature to look for (e.g. `b"nk"`).
+    pub fn find_cells(&self, signature: &[u8; 2]) -> Vec<CellInfo<'_>> {
+        let bins = &self.data.as_slice()[BASE_BLOCK_SIZE..];
+        let mut cells = Vec::new();
+        let mut offset = 0;
+        
+        while offset + HBIN_HEADER_SIZE <= bins.len() {
+            let end = match hbin_size_at(bins, offset) {
+                Ok(size) => offset + size,
+                Err(e) => {
+                    let mut next = offset + HBIN_ALIGNMENT;
+                    while next + HBIN_HEADER_SIZE <= bins.len() && hbin_size_at(bins, next).is_err() {
+                        next += HBIN_ALIGNMENT;
+                    }
+                    warn!(
+                        offset = %format!("{:#x}", offset),
+                        end = %format!("{:#x}", next.min(bins.len())),
+                        error = %e,
+                        "Damaged hbin, scanning it without its header"
+                    );
+                    next
+                }
+            }
+            .min(bins.len());
+            
+            let start = offset + HBIN_HEADER_SIZE;
+            cells.extend(find_cells(&bins[start..end], start as u32, signature));
+            offset = end;
+        }
+        
+        cells
+    }
+
+    /// Visits every key under `root_offset`, in parallel.
+    ///
+    /// Returns a [`WalkedKey`] for the root and each of its descendants.
+    /// The top of the tree is expanded breadth first until there are a few
+    /// subtrees per CPU; the subtrees are then walked depth first on scoped
+    /// threads that share one queue. The result does not depend on thread
+    /// timing, and every key comes after its parent.
+    ///
+    /// Walkers read the key cache but publish the nodes they parse in
+    /// batches, so they do not contend for the cache's write lock.
+    ///
+    /// # Arguments
+    ///
+    /// * `root_offset` - Cell offset of the key to start from.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error if a key cannot be parsed or keys are nested more
+    /// than 512 levels deep (which also catches cycles in corrupt hives).
+    pub fn walk(&self, root_offset: u32) -> Result<Vec<WalkedKey>> {
+        let threads = thread::available_parallelism().map(|n| n.get()).unwrap_or(1);
+        let mut keys = Vec::new();
+        let mut parsed = Vec::new();
+        
+        // Expand the top levels until there is enough work to share out
+        let mut frontier = vec![(root_offset, None, 0)];
+        while !frontier.is_empty() && frontier.len() < threads * WALK_SUBTREES_PER_THREAD {
+            let mut next = Vec::new();
+            for (offset, parent, depth) in frontier {
+                let (key, subkeys) = self.visit_key(offset, parent, depth, &mut parsed)?;
+                keys.push(key);
+                next.extend(subkeys.into_iter().map(|subkey| (subkey, Some(offset), depth + 1)));
+            }
+            frontier = next;
+        }
+        self.cache_key_nodes(&mut parsed);
+        
+        if threads == 1 || frontier.len() <= 1 {
+            for root in frontier {
+                self.walk_subtree(root, &mut keys)?;
+            }
+            return Ok(keys);
+        }
+        
+        let next_subtree = AtomicUsize::new(0);
+        let failed = AtomicBool::new(false);
+        let results: Vec<Result<Vec<_>>> = thread::scope(|scope| {
+            let workers: Vec<_> = (0..threads.min(frontier.len()))
+                .map(|_| {
+                    scope.spawn(|| {
+                        let mut walked = Vec::new();
+                        while !failed.load(Ordering::Relaxed) {
+                            let index = next_subtree.fetch_add(1, Ordering::Relaxed);
+                            let Some(&root) = frontier.get(index) else { break };
+                            
+                            let mut subtree = Vec::new();
+                            if let Err(e) = self.walk_subtree(root, &mut subtree) {
+                                failed.store(true, Ordering::Relaxed);
+                                return Err(e);
+                            }
+                            walked.push((index, subtree));
+                        }
+                        Ok(walked)
+                    })
+                })
+                .collect();
+            
+            workers
+                .into_iter()
+                .map(|worker| worker.join().unwrap_or_else(|panic| std::panic::resume_unwind(panic)))
+                .collect()
+        });
+        
+        // Reassemble the subtrees in frontier order
+        let mut subtrees = vec![Vec::new(); frontier.len()];
+        for result in results {
+            for (index, subtree) in result? {
+                subtrees[index] = subtree;
+            }
+        }
+        keys.extend(subtrees.into_iter().flatten());
+        
+        Ok(keys)
+    }
+
+    /// Walks the subtree rooted at `root` (offset, parent, depth) depth
+    /// first, appending its keys in pre-order.
+    fn walk_subtree(&self, root: (u32, Option<u32>, usize), keys: &mut Vec<WalkedKey>) -> Result<()> {
+        let mut parsed = Vec::new();
+        let mut stack = vec![root];
+        while let Some((offset, parent, depth)) = stack.pop() {
+            let (key, subkeys) = self.visit_key(offset, parent, depth, &mut parsed)?;
+            keys.push(key);
+            stack.extend(subkeys.into_iter().rev().map(|subkey| (subkey, Some(offset), depth + 1)));
+            
+            if parsed.len() >= WALK_CACHE_BATCH_SIZE {
+                self.cache_key_nodes(&mut parsed);
+            }
+        }
+        self.cache_key_nodes(&mut parsed);
+        Ok(())
+    }
+
+    /// Returns the key at `offset` and its subkey offsets.
+    ///
+    /// Cache misses are parsed and queued in `parsed` instead of being
+    /// cached right away; see [`Hive::cache_key_nodes`].
+    fn visit_key(
+        &self,
+        offset: u32,
+        parent: Option<u32>,
+        depth: usize,
+        parsed: &mut Vec<(u32, KeyNode)>,
+    ) -> Result<(WalkedKey, Vec<u32>)> {
+        if depth > MAX_KEY_DEPTH {
+            return Err(RegistryError::InvalidFormat(format!(
+                "Key at {:#x} is nested deeper than {} levels",
+                offset, MAX_KEY_DEPTH
+            )));
+        }
+        
+        let cached = self.key_cache.read()
+            .expect("key cache lock poisoned")
+            .get(&offset)
+            .cloned();
+        let key_node = match cached {
+            Some(key_node) => key_node,
+            None => {
+                let key_node = self.parse_key_node(offset)?;
+                parsed.push((offset, key_node.clone()));
+                key_node
+            }
+        };
+        
+        // Each key is visited once, so its subkey offsets are not worth caching
+        let key = RegistryKey { hive: self, offset, key_node, extras: OnceLock::new() };
+        let mut subkeys = Vec::new();
+        if key.key_node.has_subkeys() {
+            key.collect_subkey_offsets(key.key_node.subkey_list_offset, &mut subkeys)?;
+        }
+        
+        let name = key.key_node.name;
+        Ok((WalkedKey { offset, parent, name }, subkeys))
+    }
+
+    /// Publishes key nodes parsed by a walker to the key cache under one
+    /// write lock, keeping entries that are already cached.
+    fn cache_key_nodes(&self, parsed: &mut Vec<(u32, KeyNode)>) {
+        if parsed.is_empty() {
+            return;
+        }
+        
+        let mut cache = self.key_cache.write().expect("key cache lock poisoned");
+        for (offset, key_node) in parsed.drain(..) {
+            cache.entry(offset).or_insert(key_node);
+        }
+    }
+
     /// Debug method: Read raw bytes at an absolute offset.
     /// This is for debugging purposes only.
     #[doc(hidden)]
@@ -443,7 +819,9 @@ impl Hive {
     /// Opens a hive with transaction logs applied.
     ///
     /// This method opens a base hive and applies transaction logs (.LOG1, .LOG2)
-    /// to recover uncommitted changes. The resulting hive is loaded into memory.
+    /// to recover uncommitted changes. The base hive and the logs are
+    /// memory-mapped; the hive is only copied into memory when the logs
+    /// actually contain dirty pages to apply.
     ///
     /// # Arguments
     ///
@@ -461,7 +839,7 @@ impl Hive {
     /// # Examples
     ///
     /// ```no_run
-    /// use reg_parser::Hive;
+    /// use regrs::Hive;
     ///
     /// let hive = Hive::open_with_logs(
     ///     "SYSTEM",
@@ -474,13 +852,21 @@ impl Hive {
         log1_path: Option<P>,
         log2_path: Option<P>,
     ) -> Result<Self> {
-        // Read base hive into memory
-        let mut file = File::open(hive_path)?;
-        let mut hive_data = Vec::new();
-        std::io::Read::read_to_end(&mut file, &mut hive_data)?;
+        let mmap = Self::map_file(hive_path)?;
+        let logs = load_transaction_logs(log1_path, log2_path);
+
+        // Nothing to replay - keep serving the hive straight from the mapping
+        if logs.iter().all(|log| log.dirty_pages.is_empty()) {
+            debug!("No dirty pages in transaction logs, using mapped hive");
+            return Self::from_mmap(mmap);
+        }
+
+        // Copy the base hive only once we know it has to be modified
+        let mut hive_data = mmap.to_vec();
+        drop(mmap);
 
         // Apply transaction logs
-        let applied = merge_transaction_logs(&mut hive_data, log1_path, log2_path)?;
+        let applied = apply_transaction_logs(&mut hive_data, &logs)?;
         
         if applied > 0 {
             // Recalculate checksum after applying logs
@@ -536,7 +922,7 @@ impl Hive {
     /// # Examples
     ///
     /// ```no_run
-    /// use reg_parser::Hive;
+    /// use regrs::Hive;
     ///
     /// let hive = Hive::open_with_logs(
     ///     "SYSTEM",
@@ -594,6 +980,22 @@ impl Hive {
     }
 }
 
+/// Returns the size of the hbin at `offset` in the hbin data, if it has a
+/// valid header and a 4KB-multiple size.
+fn hbin_size_at(bins: &[u8], offset: usize) -> Result<usize> {
+    let hbin = HbinHeader::parse(&bins[offset..], offset as u32)?;
+    let size = hbin.size as usize;
+    
+    if size == 0 || size % HBIN_ALIGNMENT != 0 {
+        return Err(RegistryError::InvalidFormat(format!(
+            "Hbin at {:#x} has invalid size {:#x}",
+            offset, size
+        )));
+    }
+    
+    Ok(size)
+}
+
 /// Iterator over hbins in a hive.
 pub struct HbinIterator<'a> {
     data: &'a [u8],
@@ -625,12 +1027,29 @@ impl<'a> Iterator for HbinIterator<'a> {
     }
 }
 
+/// A key visited by [`Hive::walk`].
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct WalkedKey {
+    /// Cell offset of the key (relative to first hbin).
+    pub offset: u32,
+    
+    /// Cell offset of the key it was reached from, or `None` for the key
+    /// the walk started at.
+    pub parent: Option<u32>,
+    
+    /// Key name.
+    pub name: String,
+}
+
 /// A registry key with access to its hive.
 pub struct RegistryKey<'a> {
     hive: &'a Hive,
     /// Cell offset of this key (relative to first hbin).
     pub offset: u32,
     key_node: KeyNode,
+    /// Lookup data shared with every other handle to this key, fetched
+    /// from the hive on first use.
+    extras: OnceLock<Arc<KeyExtras>>,
 }
 
 impl<'a> RegistryKey<'a> {
@@ -639,6 +1058,11 @@ impl<'a> RegistryKey<'a> {
         &self.key_node
     }
 
+    /// Returns the lazily built lookup data of this key.
+    fn extras(&self) -> &KeyExtras {
+        self.extras.get_or_init(|| self.hive.key_extras(self.offset))
+    }
+
     /// Debug method: Returns the key node data for debugging.
     #[doc(hidden)]
     pub fn debug_key_node(&self) -> &KeyNode {
@@ -667,48 +1091,223 @@ impl<'a> RegistryKey<'a> {
     }
 
     /// Returns an iterator over subkeys.
-    pub fn subkeys(&self) -> Result<Vec<RegistryKey>> {
-        let key_node = self.key_node();
-        
-        if !key_node.has_subkeys() {
-            return Ok(Vec::new());
+    pub fn subkeys(&self) -> Result<Vec<RegistryKey<'_>>> {
+        let subkey_offsets = self.subkey_offsets()?;
+        self.hive.get_keys(&subkey_offsets)
+    }
+
+    /// Returns the cell offsets of all subkeys without parsing them.
+    ///
+    /// The offsets can be resolved later with [`Hive::get_key`], which lets
+    /// callers enumerate subkeys lazily.
+    pub fn subkey_offsets(&self) -> Result<Vec<u32>> {
+        Ok(self.cached_subkey_offsets()?.to_vec())
+    }
+
+    /// Returns the subkey at `index` in list order, or `None` if `index`
+    /// is out of range.
+    ///
+    /// The subkey lists are walked once per key and the offsets are
+    /// cached, so each call after the first is a constant-time lookup.
+    pub fn subkey_at(&self, index: usize) -> Result<Option<RegistryKey<'a>>> {
+        match self.cached_subkey_offsets()?.get(index) {
+            Some(&offset) => self.hive.get_key(offset).map(Some),
+            None => Ok(None),
         }
+    }
 
+    /// Returns the subkey offsets, collecting them on first use.
+    fn cached_subkey_offsets(&self) -> Result<&[u32]> {
+        let cell = &self.extras().subkey_offsets;
+        if let Some(offsets) = cell.get() {
+            return Ok(offsets);
+        }
+        
+        let key_node = self.key_node();
         let mut subkey_offsets = Vec::new();
-        self.collect_subkey_offsets(key_node.subkey_list_offset, &mut subkey_offsets)?;
+        if key_node.has_subkeys() {
+            self.collect_subkey_offsets(key_node.subkey_list_offset, &mut subkey_offsets)?;
+        }
+        
+        let _ = cell.set(subkey_offsets);
+        Ok(cell.get().expect("subkey offsets were just set"))
+    }
 
-        let mut subkeys = Vec::new();
-        for offset in subkey_offsets {
-            subkeys.push(self.hive.get_key(offset)?);
+    /// Collects subkey offsets from subkey lists, depth first in list order.
+    ///
+    /// # Errors
+    ///
+    /// Returns `RegistryError::InvalidFormat` if an index root references a
+    /// list that was already visited, which would otherwise loop forever on
+    /// a corrupt hive.
+    fn collect_subkey_offsets(&self, list_offset: u32, offsets: &mut Vec<u32>) -> Result<()> {
+        let mut visited = HashSet::new();
+        let mut pending = vec![list_offset];
+
+        while let Some(list_offset) = pending.pop() {
+            if list_offset == 0xFFFFFFFF || list_offset == 0 {
+                continue;
+            }
+            check_subkey_list_visited(&mut visited, list_offset)?;
+
+            let subkey_list = self.hive.parse_subkey_list(list_offset)?;
+
+            if subkey_list.is_index_root() {
+                // Index root contains offsets to other subkey lists; push
+                // them reversed so they are visited in list order
+                let start = pending.len();
+                pending.extend(subkey_list.key_offsets_iter());
+                pending[start..].reverse();
+            } else {
+                // Direct key offsets - use iterator to avoid cloning
+                offsets.extend(subkey_list.key_offsets_iter());
+            }
         }
 
-        Ok(subkeys)
+        Ok(())
     }
 
-    /// Recursively collects subkey offsets from subkey lists.
-    fn collect_subkey_offsets(&self, list_offset: u32, offsets: &mut Vec<u32>) -> Result<()> {
-        if list_offset == 0xFFFFFFFF || list_offset == 0 {
-            return Ok(());
+    /// Looks up a direct subkey by name (case-insensitive).
+    ///
+    /// The first lookup on a key builds a [`SubkeyIndex`] from its subkey
+    /// lists; later lookups binary search that index by name hash and only
+    /// parse the candidate keys.
+    ///
+    /// # Errors
+    ///
+    /// Returns `RegistryError::NotFound` if there is no subkey with that name.
+    pub fn subkey_by_name(&self, name: &str) -> Result<RegistryKey<'a>> {
+        let index = self.subkey_index()?;
+        
+        for offset in index.find(name_hash(name)) {
+            let subkey = self.hive.get_key(offset)?;
+            if key_names_match(&subkey.key_node().name, name) {
+                return Ok(subkey);
+            }
+        }
+        
+        // Windows upper-cases non-ASCII names with its own table, so the
+        // stored hash may not match ours; fall back to a full scan
+        if !name.is_ascii() {
+            let subkey_offsets = self.subkey_offsets()?;
+            for subkey in self.hive.get_keys(&subkey_offsets)? {
+                if key_names_match(&subkey.key_node().name, name) {
+                    return Ok(subkey);
+                }
+            }
         }
+        
+        Err(RegistryError::NotFound(format!("Subkey '{}'", name)))
+    }
 
-        let subkey_list = self.hive.parse_subkey_list(list_offset)?;
+    /// Returns the subkey index of this key, building it on first use.
+    fn subkey_index(&self) -> Result<&SubkeyIndex> {
+        let cell = &self.extras().subkey_index;
+        if let Some(index) = cell.get() {
+            return Ok(index);
+        }
+        
+        let index = self.build_subkey_index()?;
+        // A concurrent builder may have won the race; both indexes are equal
+        let _ = cell.set(index);
+        Ok(cell.get().expect("subkey index was just set"))
+    }
 
-        if subkey_list.is_index_root() {
-            // Index root contains offsets to other subkey lists
-            // Use iterator to avoid cloning
-            for offset in subkey_list.key_offsets_iter() {
-                self.collect_subkey_offsets(offset, offsets)?;
+    /// Walks the subkey lists breadth first and collects `(name_hash, offset)`
+    /// pairs for every subkey.
+    ///
+    /// `lh` lists store the name hash on disk. `lf` and `li` lists do not, so
+    /// their keys are parsed and hashed by name.
+    ///
+    /// # Errors
+    ///
+    /// Returns `RegistryError::InvalidFormat` if a subkey list is referenced
+    /// more than once.
+    fn build_subkey_index(&self) -> Result<SubkeyIndex> {
+        let key_node = self.key_node();
+        let mut entries = Vec::with_capacity(key_node.subkey_count as usize);
+        
+        if !key_node.has_subkeys() {
+            return Ok(SubkeyIndex::new(entries));
+        }
+
+        let mut unhashed = Vec::new();
+        let mut visited = HashSet::new();
+        let mut pending = VecDeque::from([key_node.subkey_list_offset]);
+        
+        while let Some(list_offset) = pending.pop_front() {
+            if list_offset == 0xFFFFFFFF || list_offset == 0 {
+                continue;
+            }
+            check_subkey_list_visited(&mut visited, list_offset)?;
+            
+            let cell_data = self.hive.read_cell(list_offset)?;
+            let subkey_list = SubkeyList::parse(cell_data, list_offset)?;
+            
+            match subkey_list {
+                SubkeyList::IndexRoot(list_offsets) => pending.extend(list_offsets),
+                SubkeyList::LeafWithHints(list_entries) if &cell_data[0..2] == b"lh" => {
+                    entries.extend(list_entries.iter().map(|e| (e.name_hint, e.key_offset)));
+                }
+                other => unhashed.extend(other.key_offsets_iter()),
+            }
+        }
+        
+        if !unhashed.is_empty() {
+            for subkey in self.hive.get_keys(&unhashed)? {
+                entries.push((name_hash(&subkey.key_node().name), subkey.offset));
             }
-        } else {
-            // Direct key offsets - use iterator to avoid cloning
-            offsets.extend(subkey_list.key_offsets_iter());
         }
 
-        Ok(())
+        Ok(SubkeyIndex::new(entries))
     }
 
     /// Returns an iterator over values.
-    pub fn values(&self) -> Result<Vec<RegistryValue>> {
+    pub fn values(&self) -> Result<Vec<RegistryValue<'_>>> {
+        let value_offsets = self.value_offsets()?;
+        
+        let mut values = Vec::with_capacity(value_offsets.len());
+        for offset in value_offsets {
+            values.push(self.hive.get_value(offset)?);
+        }
+
+        Ok(values)
+    }
+
+    /// Returns the cell offsets of all values without parsing them.
+    ///
+    /// The offsets can be resolved later with [`Hive::get_value`], which lets
+    /// callers enumerate values lazily.
+    pub fn value_offsets(&self) -> Result<Vec<u32>> {
+        Ok(self.cached_value_offsets()?.to_vec())
+    }
+
+    /// Returns the value at `index` in list order, or `None` if `index`
+    /// is out of range.
+    ///
+    /// The value list is read once per key and the offsets are cached, so
+    /// each call after the first is a constant-time lookup.
+    pub fn value_at(&self, index: usize) -> Result<Option<RegistryValue<'a>>> {
+        match self.cached_value_offsets()?.get(index) {
+            Some(&offset) => self.hive.get_value(offset).map(Some),
+            None => Ok(None),
+        }
+    }
+
+    /// Returns the value offsets, reading the value list on first use.
+    fn cached_value_offsets(&self) -> Result<&[u32]> {
+        let cell = &self.extras().value_offsets;
+        if let Some(offsets) = cell.get() {
+            return Ok(offsets);
+        }
+        
+        let value_offsets = self.read_value_offsets()?;
+        let _ = cell.set(value_offsets);
+        Ok(cell.get().expect("value offsets were just set"))
+    }
+
+    /// Reads the value offsets from the value list cell.
+    fn read_value_offsets(&self) -> Result<Vec<u32>> {
         let key_node = self.key_node();
         
         if !key_node.has_values() {
@@ -731,28 +1330,22 @@ impl<'a> RegistryKey<'a> {
             });
         }
 
-        let mut values = Vec::new();
+        let mut offsets = Vec::with_capacity(value_count);
         for i in 0..value_count {
             let offset_pos = i * 4;
-            let offset = u32::from_le_bytes([
+            offsets.push(u32::from_le_bytes([
                 list_data[offset_pos],
                 list_data[offset_pos + 1],
                 list_data[offset_pos + 2],
                 list_data[offset_pos + 3],
-            ]);
-
-            let value_key = self.hive.parse_value_key(offset)?;
-            values.push(RegistryValue {
-                hive: self.hive,
-                value_key,
-            });
+            ]));
         }
 
-        Ok(values)
+        Ok(offsets)
     }
 
     /// Gets a specific value by name.
-    pub fn value(&self, name: &str) -> Result<RegistryValue> {
+    pub fn value(&self, name: &str) -> Result<RegistryValue<'_>> {
         let values = self.values()?;
         
         for value in values {
@@ -765,6 +1358,32 @@ impl<'a> RegistryKey<'a> {
     }
 }
 
+/// Compares key names the way the registry does (case-insensitive).
+fn key_names_match(key_name: &str, name: &str) -> bool {
+    if key_name.is_ascii() && name.is_ascii() {
+        key_name.eq_ignore_ascii_case(name)
+    } else {
+        key_name.to_uppercase() == name.to_uppercase()
+    }
+}
+
+/// Records `list_offset` as visited while walking a key's subkey lists.
+///
+/// # Errors
+///
+/// Returns `RegistryError::InvalidFormat` if the list was already visited,
+/// i.e. an index root refers to itself or to another list of the same key.
+fn check_subkey_list_visited(visited: &mut HashSet<u32>, list_offset: u32) -> Result<()> {
+    if visited.insert(list_offset) {
+        Ok(())
+    } else {
+        Err(RegistryError::InvalidFormat(format!(
+            "Subkey list at {:#x} is referenced more than once",
+            list_offset
+        )))
+    }
+}
+
 /// A registry value.
 pub struct RegistryValue<'a> {
     hive: &'a Hive,
@@ -796,6 +1415,28 @@ impl<'a> RegistryValue<'a> {
         ValueData::parse(&raw_data, self.value_key.data_type, self.value_key.data_offset)
     }
 
+    /// Returns the offset of the cell holding the value data and the data
+    /// length, if the data is stored in a single cell.
+    ///
+    /// Such data can be borrowed straight from the hive with
+    /// [`Hive::read_cell_data`]. Inline data and big data blocks are not
+    /// stored contiguously and return `None`; use
+    /// [`RegistryValue::raw_data`] for those.
+    pub fn data_cell(&self) -> Option<(u32, usize)> {
+        let value_key = &self.value_key;
+        
+        if value_key.is_inline_data()
+            || value_key.data_length == 0
+            || value_key.data_length > MAX_DIRECT_DATA_SIZE
+            || value_key.data_offset == 0xFFFFFFFF
+            || value_key.data_offset == 0
+        {
+            return None;
+        }
+
+        Some((value_key.data_offset, value_key.data_length as usize))
+    }
+
     /// Returns the raw value data as bytes.
     pub fn raw_data(&self) -> Result<Vec<u8>> {
         if self.value_key.is_inline_data() {
@@ -811,5 +1452,74 @@ impl<'a> RegistryValue<'a> {
 
 #[cfg(test)]
 mod tests {
-    // Tests are in tests/ directory using real hive files
+    // Most tests are in tests/ directory using real hive files
+    use super::*;
+    use crate::utils::calculate_checksum;
+
+    #[test]
+    fn test_find_cells_skips_damaged_hbin() {
+        let mut data = vec![0u8; BASE_BLOCK_SIZE + 3 * HBIN_ALIGNMENT];
+        data[0..4].copy_from_slice(b"regf");
+        data[0x14..0x18].copy_from_slice(&1u32.to_le_bytes());
+        data[0x18..0x1C].copy_from_slice(&5u32.to_le_bytes());
+        let checksum = calculate_checksum(&data);
+        data[0x1FC..0x200].copy_from_slice(&checksum.to_le_bytes());
+        
+        // A two-page hbin with a damaged signature, followed by a valid one
+        let bins = &mut data[BASE_BLOCK_SIZE..];
+        bins[0..4].copy_from_slice(b"hb\0n");
+        bins[0x08..0x0C].copy_from_slice(&0x2000u32.to_le_bytes());
+        bins[0x2000..0x2004].copy_from_slice(b"hbin");
+        bins[0x2004..0x2008].copy_from_slice(&0x2000u32.to_le_bytes());
+        bins[0x2008..0x200C].copy_from_slice(&0x1000u32.to_le_bytes());
+        for offset in [0x20, 0x1010, 0x2020] {
+            bins[offset..offset + 4].copy_from_slice(&(-0x60i32).to_le_bytes());
+            bins[offset + 4..offset + 6].copy_from_slice(b"nk");
+        }
+        
+        let hive = Hive::from_vec(data).unwrap();
+        let offsets: Vec<u32> = hive.find_cells(b"nk").iter().map(|cell| cell.offset).collect();
+        assert_eq!(offsets, [0x20, 0x1010, 0x2020]);
+    }
+
+    #[test]
+    fn test_self_referencing_index_root() {
+        let mut data = vec![0u8; BASE_BLOCK_SIZE + HBIN_ALIGNMENT];
+        data[0..4].copy_from_slice(b"regf");
+        data[0x14..0x18].copy_from_slice(&1u32.to_le_bytes());
+        data[0x18..0x1C].copy_from_slice(&5u32.to_le_bytes());
+        data[0x24..0x28].copy_from_slice(&0x20u32.to_le_bytes());
+        data[0x28..0x2C].copy_from_slice(&(HBIN_ALIGNMENT as u32).to_le_bytes());
+        let checksum = calculate_checksum(&data);
+        data[0x1FC..0x200].copy_from_slice(&checksum.to_le_bytes());
+        
+        let bins = &mut data[BASE_BLOCK_SIZE..];
+        bins[0..4].copy_from_slice(b"hbin");
+        bins[0x08..0x0C].copy_from_slice(&(HBIN_ALIGNMENT as u32).to_le_bytes());
+        
+        // Root key with one subkey whose list is an ri pointing at itself
+        let nk = &mut bins[0x20..0x80];
+        nk[0..4].copy_from_slice(&(-0x60i32).to_le_bytes());
+        nk[4..6].copy_from_slice(b"nk");
+        nk[6..8].copy_from_slice(&0x20u16.to_le_bytes());
+        nk[0x18..0x1C].copy_from_slice(&1u32.to_le_bytes());
+        nk[0x20..0x24].copy_from_slice(&0x100u32.to_le_bytes());
+        for field in [0x24, 0x2C, 0x30, 0x34] {
+            nk[field..field + 4].copy_from_slice(&0xFFFFFFFFu32.to_le_bytes());
+        }
+        nk[0x4C..0x4E].copy_from_slice(&4u16.to_le_bytes());
+        nk[0x50..0x54].copy_from_slice(b"ROOT");
+        
+        let ri = &mut bins[0x100..0x110];
+        ri[0..4].copy_from_slice(&(-0x10i32).to_le_bytes());
+        ri[4..6].copy_from_slice(b"ri");
+        ri[6..8].copy_from_slice(&1u16.to_le_bytes());
+        ri[8..12].copy_from_slice(&0x100u32.to_le_bytes());
+        
+        let hive = Hive::from_vec(data).unwrap();
+        let root = hive.root_key().unwrap();
+        assert!(matches!(root.subkey_offsets(), Err(RegistryError::InvalidFormat(_))));
+        assert!(matches!(root.subkey_by_name("Sub"), Err(RegistryError::InvalidFormat(_))));
+        assert!(matches!(hive.walk(0x20), Err(RegistryError::InvalidFormat(_))));
+    }
 }
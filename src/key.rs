@@ -2,7 +2,7 @@
 
 use crate::cell::KeyNodeFlags;
 use crate::error::{RegistryError, Result};
-use crate::utils::{read_ascii_string, read_u16_le, read_u32_le, read_utf16_string};
+use crate::utils::{read_ascii_string, read_record, read_utf16_string, record_u16, record_u32};
 
 /// Minimum size of a key node structure in bytes.
 const KEY_NODE_MIN_SIZE: usize = 76;
@@ -89,51 +89,46 @@ impl KeyNode {
     ///
     /// Returns an error if the data is malformed or truncated.
     pub fn parse(data: &[u8], offset: u32) -> Result<Self> {
-        if data.len() < KEY_NODE_MIN_SIZE {
-            return Err(RegistryError::TruncatedData {
-                offset,
-                expected: KEY_NODE_MIN_SIZE,
-                actual: data.len(),
-            });
-        }
+        // Fixed-size header; checked once, then fields are read in place
+        let record = read_record::<KEY_NODE_MIN_SIZE>(data, offset)?;
 
         // Verify signature
-        if &data[0..2] != b"nk" {
+        if &record[0..2] != b"nk" {
             return Err(RegistryError::InvalidFormat(format!(
                 "Expected 'nk' signature at offset {:#x}",
                 offset
             )));
         }
 
-        let flags = KeyNodeFlags::new(read_u16_le(data, 0x02)?);
+        let flags = KeyNodeFlags::new(record_u16(record, 0x02));
         
         // Last written timestamp at offset 0x04 (8 bytes)
-        let last_written = u64::from(read_u32_le(data, 0x04)?)
-            | (u64::from(read_u32_le(data, 0x08)?) << 32);
+        let last_written = u64::from(record_u32(record, 0x04))
+            | (u64::from(record_u32(record, 0x08)) << 32);
         
-        let access_bits = read_u32_le(data, 0x0C)?;
-        let parent_offset = read_u32_le(data, 0x10)?;
-        let subkey_count = read_u32_le(data, 0x14)?;
-        let volatile_subkey_count = read_u32_le(data, 0x18)?;
-        let subkey_list_offset = read_u32_le(data, 0x1C)?;
-        let volatile_subkey_list_offset = read_u32_le(data, 0x20)?;
-        let value_count = read_u32_le(data, 0x24)?;
-        let value_list_offset = read_u32_le(data, 0x28)?;
-        let security_offset = read_u32_le(data, 0x2C)?;
-        let class_name_offset = read_u32_le(data, 0x30)?;
+        let access_bits = record_u32(record, 0x0C);
+        let parent_offset = record_u32(record, 0x10);
+        let subkey_count = record_u32(record, 0x14);
+        let volatile_subkey_count = record_u32(record, 0x18);
+        let subkey_list_offset = record_u32(record, 0x1C);
+        let volatile_subkey_list_offset = record_u32(record, 0x20);
+        let value_count = record_u32(record, 0x24);
+        let value_list_offset = record_u32(record, 0x28);
+        let security_offset = record_u32(record, 0x2C);
+        let class_name_offset = record_u32(record, 0x30);
         
-        let max_subkey_name_len = read_u32_le(data, 0x34)?;
-        let max_subkey_class_len = read_u32_le(data, 0x38)?;
-        let max_value_name_len = read_u32_le(data, 0x3C)?;
-        let max_value_data_len = read_u32_le(data, 0x40)?;
-        let work_var = read_u32_le(data, 0x44)?;
+        let max_subkey_name_len = record_u32(record, 0x34);
+        let max_subkey_class_len = record_u32(record, 0x38);
+        let max_value_name_len = record_u32(record, 0x3C);
+        let max_value_data_len = record_u32(record, 0x40);
+        let work_var = record_u32(record, 0x44);
         
-        let name_length = read_u16_le(data, 0x48)?;
-        let class_name_length = read_u16_le(data, 0x4A)?;
+        let name_length = record_u16(record, 0x48);
+        let class_name_length = record_u16(record, 0x4A);
         
         // Key name starts at offset 0x4C
         let name = if name_length > 0 {
-            let name_end = 0x4C + name_length as usize;
+            let name_end = KEY_NAME_OFFSET + name_length as usize;
             if name_end > data.len() {
                 return Err(RegistryError::TruncatedData {
                     offset,
@@ -142,7 +137,7 @@ impl KeyNode {
                 });
             }
             
-            let name_data = &data[0x4C..name_end];
+            let name_data = &data[KEY_NAME_OFFSET..name_end];
             
             if flags.is_compressed() {
                 // ASCII name
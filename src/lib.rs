@@ -50,7 +50,7 @@
 //! ### Basic Usage
 //!
 //! ```no_run
-//! use reg_parser::Hive;
+//! use regrs::Hive;
 //!
 //! # fn main() -> Result<(), Box<dyn std::error::Error>> {
 //! // Open a registry hive
@@ -76,7 +76,7 @@
 //! ### Accessing Specific Values
 //!
 //! ```no_run
-//! use reg_parser::{Hive, ValueData};
+//! use regrs::{Hive, ValueData};
 //!
 //! # fn main() -> Result<(), Box<dyn std::error::Error>> {
 //! let mut hive = Hive::open("SOFTWARE")?;
@@ -138,9 +138,9 @@ pub use error::{RegistryError, Result};
 pub use hbin::HbinHeader;
 pub use hive::HbinIterator;
 pub use header::BaseBlock;
-pub use hive::{Hive, RegistryKey, RegistryValue};
+pub use hive::{Hive, RegistryKey, RegistryValue, WalkedKey};
 pub use key::KeyNode;
-pub use subkey_list::{SubkeyList, SubkeyListEntry, SubkeyListType};
+pub use subkey_list::{SubkeyIndex, SubkeyList, SubkeyListEntry, SubkeyListType};
 pub use transaction_log::{TransactionLog, DirtyPage};
 pub use value::{ValueData, ValueKey};
 
@@ -153,6 +153,6 @@ mod tests {
 
     #[test]
     fn test_version() {
-        assert!(!VERSION.is_empty());
+        assert_eq!(VERSION.split('.').count(), 3);
     }
 }
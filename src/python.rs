@@ -3,15 +3,29 @@
 //! This module provides Python-friendly wrappers around the core Rust types.
 
 use pyo3::prelude::*;
-use pyo3::exceptions::{PyIOError, PyValueError, PyRuntimeError};
-use pyo3::types::PyBytes;
+use pyo3::exceptions::{PyBufferError, PyIOError, PyIndexError, PyValueError, PyRuntimeError};
+use pyo3::ffi;
+use pyo3::intern;
+use pyo3::types::{PyBytes, PyDict, PyList, PyMemoryView, PyString};
+use regex::Regex;
+use std::any::Any;
+use std::collections::HashMap;
+use std::ops::Deref;
+use std::os::raw::{c_char, c_int, c_void};
+use std::ptr;
 use std::panic::{catch_unwind, AssertUnwindSafe};
-use std::sync::Arc;
+use std::sync::{Arc, Mutex};
 
-use crate::{Hive as RustHive};
+use crate::{Hive as RustHive, RegistryValue as RustRegistryValue};
 use crate::{ValueData as RustValueData, ValueType as RustValueType};
 use crate::{BaseBlock as RustBaseBlock, HbinHeader as RustHbinHeader};
+use crate::{KeyNode as RustKeyNode, WalkedKey};
 use crate::RegistryError;
+use crate::hbin::HBIN_SIGNATURE;
+use crate::header::REGF_SIGNATURE;
+
+/// Value data size above which parsing releases the GIL
+const GIL_RELEASE_MIN_DATA_SIZE: usize = 4096;
 
 /// Convert Rust RegistryError to Python exception
 fn registry_error_to_py(err: RegistryError) -> PyErr {
@@ -110,100 +124,175 @@ fn registry_error_to_py(err: RegistryError) -> PyErr {
     }
 }
 
-/// Python wrapper for BaseBlock
-#[pyclass(name = "BaseBlock")]
-#[derive(Clone)]
-pub struct PyBaseBlock {
-    inner: RustBaseBlock,
+/// Convert a caught Rust panic to Python exception
+fn panic_to_py(panic_err: Box<dyn Any + Send>) -> PyErr {
+    let panic_msg = if let Some(s) = panic_err.downcast_ref::<&str>() {
+        format!("Rust panic: {}", s)
+    } else if let Some(s) = panic_err.downcast_ref::<String>() {
+        format!("Rust panic: {}", s)
+    } else {
+        "Rust panic: unknown error".to_string()
+    };
+    PyRuntimeError::new_err(panic_msg)
 }
 
-#[pymethods]
-impl PyBaseBlock {
-    /// Get the signature (should be "regf")
-    #[getter]
-    fn signature(&self) -> String {
-        String::from_utf8_lossy(&self.inner.signature).to_string()
-    }
+/// Most distinct names a `NameCache` holds
+const NAME_CACHE_MAX_ENTRIES: usize = 4096;
 
-    /// Get the primary sequence number
-    #[getter]
-    fn primary_sequence(&self) -> u32 {
-        self.inner.primary_sequence
-    }
+/// Cache of Python strings for key and value names
+///
+/// Names repeat heavily within a hive ("(default)", "Parameters", ...), so
+/// each distinct name is converted to a Python string once and the same
+/// object is handed out on every later access. The cache lives as long as
+/// the hive, so it stops growing at `NAME_CACHE_MAX_ENTRIES`; names seen
+/// after that get a fresh string each time.
+#[derive(Default)]
+struct NameCache {
+    names: Mutex<HashMap<String, Py<PyString>>>,
+}
 
-    /// Get the secondary sequence number
-    #[getter]
-    fn secondary_sequence(&self) -> u32 {
-        self.inner.secondary_sequence
+impl NameCache {
+    /// Get the cached Python string for `name`, creating it on first use
+    fn get(&self, py: Python<'_>, name: &str) -> Py<PyString> {
+        // Only ever locked with the GIL held, so this never contends
+        let mut names = self.names.lock().expect("name cache lock poisoned");
+        
+        if let Some(cached) = names.get(name) {
+            return cached.clone_ref(py);
+        }
+        
+        let interned: Py<PyString> = PyString::new(py, name).into();
+        if names.len() < NAME_CACHE_MAX_ENTRIES {
+            names.insert(name.to_string(), interned.clone_ref(py));
+        }
+        interned
     }
+}
 
-    /// Get the root cell offset
-    #[getter]
-    fn root_cell_offset(&self) -> u32 {
-        self.inner.root_cell_offset
-    }
+/// Rust hive shared by all Python objects created from one `Hive`
+struct SharedHive {
+    hive: RustHive,
+    names: NameCache,
+}
 
-    /// Get the hive length (size of hive data in bytes)
-    #[getter]
-    fn hive_length(&self) -> u32 {
-        self.inner.hive_length
+impl SharedHive {
+    fn new(hive: RustHive) -> Self {
+        SharedHive {
+            hive,
+            names: NameCache::default(),
+        }
     }
+}
 
-    /// Get the file name
-    #[getter]
-    fn file_name(&self) -> String {
-        self.inner.file_name.clone()
+impl Deref for SharedHive {
+    type Target = RustHive;
+
+    fn deref(&self) -> &RustHive {
+        &self.hive
     }
+}
 
-    /// Get the hive bins data size (same as hive_length)
-    #[getter]
-    fn hive_bins_data_size(&self) -> u32 {
-        self.inner.hive_length
+/// Python string for a 4-byte signature, interned when it matches `expected`
+fn signature_to_py<'py>(
+    py: Python<'py>,
+    signature: &[u8; 4],
+    expected: &[u8; 4],
+    interned: &'py PyString,
+) -> &'py PyString {
+    if signature == expected {
+        interned
+    } else {
+        PyString::new(py, &String::from_utf8_lossy(signature))
     }
+}
 
-    fn __repr__(&self) -> String {
-        format!(
-            "BaseBlock(signature={}, root_offset={:#x}, hive_length={:#x})",
-            self.signature(),
-            self.root_cell_offset(),
-            self.hive_length()
-        )
+/// Repr of an integer attribute in hex, or its plain repr if it is not a
+/// non-negative integer (the attributes are writable)
+fn hex_repr(value: &PyAny) -> PyResult<String> {
+    match value.extract::<u64>() {
+        Ok(number) => Ok(format!("{:#x}", number)),
+        Err(_) => Ok(value.repr()?.to_string()),
     }
 }
 
-/// Python wrapper for HbinHeader
-#[pyclass(name = "HbinHeader")]
-#[derive(Clone)]
-pub struct PyHbinHeader {
-    inner: RustHbinHeader,
+/// Python wrapper for BaseBlock
+///
+/// All header fields are stored as plain attributes in the instance
+/// `__dict__` when the object is created, so attribute access is a dict
+/// lookup and never calls back into Rust. The dict is the only copy of the
+/// fields; `__repr__` reads it too, so an assigned attribute shows up there.
+#[pyclass(name = "BaseBlock", dict)]
+pub struct PyBaseBlock {}
+
+impl PyBaseBlock {
+    /// Create the Python object with its attributes pre-filled
+    fn new_py(py: Python<'_>, inner: &RustBaseBlock) -> PyResult<Py<Self>> {
+        let obj = Py::new(py, PyBaseBlock {})?;
+        let dict: &PyDict = obj.as_ref(py).getattr(intern!(py, "__dict__"))?.downcast()?;
+        
+        dict.set_item(
+            intern!(py, "signature"),
+            signature_to_py(py, &inner.signature, REGF_SIGNATURE, intern!(py, "regf")),
+        )?;
+        dict.set_item(intern!(py, "primary_sequence"), inner.primary_sequence)?;
+        dict.set_item(intern!(py, "secondary_sequence"), inner.secondary_sequence)?;
+        dict.set_item(intern!(py, "root_cell_offset"), inner.root_cell_offset)?;
+        dict.set_item(intern!(py, "hive_length"), inner.hive_length)?;
+        dict.set_item(intern!(py, "file_name"), &inner.file_name)?;
+        // Same as hive_length
+        dict.set_item(intern!(py, "hive_bins_data_size"), inner.hive_length)?;
+        
+        Ok(obj)
+    }
 }
 
 #[pymethods]
-impl PyHbinHeader {
-    /// Get the signature (should be "hbin")
-    #[getter]
-    fn signature(&self) -> String {
-        String::from_utf8_lossy(&self.inner.signature).to_string()
+impl PyBaseBlock {
+    fn __repr__(slf: &PyCell<Self>) -> PyResult<String> {
+        let py = slf.py();
+        Ok(format!(
+            "BaseBlock(signature={}, root_offset={}, hive_length={})",
+            slf.getattr(intern!(py, "signature"))?.str()?,
+            hex_repr(slf.getattr(intern!(py, "root_cell_offset"))?)?,
+            hex_repr(slf.getattr(intern!(py, "hive_length"))?)?
+        ))
     }
+}
 
-    /// Get the offset from the start of the hive bins data
-    #[getter]
-    fn offset(&self) -> u32 {
-        self.inner.offset
-    }
+/// Python wrapper for HbinHeader
+///
+/// Like BaseBlock, the header fields are stored in the instance `__dict__`
+/// when the object is created, and `__repr__` reads them from there.
+#[pyclass(name = "HbinHeader", dict)]
+pub struct PyHbinHeader {}
 
-    /// Get the size of this hbin
-    #[getter]
-    fn size(&self) -> u32 {
-        self.inner.size
+impl PyHbinHeader {
+    /// Create the Python object with its attributes pre-filled
+    fn new_py(py: Python<'_>, inner: &RustHbinHeader) -> PyResult<Py<Self>> {
+        let obj = Py::new(py, PyHbinHeader {})?;
+        let dict: &PyDict = obj.as_ref(py).getattr(intern!(py, "__dict__"))?.downcast()?;
+        
+        dict.set_item(
+            intern!(py, "signature"),
+            signature_to_py(py, &inner.signature, HBIN_SIGNATURE, intern!(py, "hbin")),
+        )?;
+        // Offset from the start of the hive bins data
+        dict.set_item(intern!(py, "offset"), inner.offset)?;
+        dict.set_item(intern!(py, "size"), inner.size)?;
+        
+        Ok(obj)
     }
+}
 
-    fn __repr__(&self) -> String {
-        format!(
-            "HbinHeader(offset={:#x}, size={:#x})",
-            self.offset(),
-            self.size()
-        )
+#[pymethods]
+impl PyHbinHeader {
+    fn __repr__(slf: &PyCell<Self>) -> PyResult<String> {
+        let py = slf.py();
+        Ok(format!(
+            "HbinHeader(offset={}, size={})",
+            hex_repr(slf.getattr(intern!(py, "offset"))?)?,
+            hex_repr(slf.getattr(intern!(py, "size"))?)?
+        ))
     }
 }
 
@@ -338,21 +427,149 @@ impl PyValueData {
     }
 }
 
+/// Location of a registry value's raw bytes
+enum RawData {
+    /// Data stored in a single hive cell, borrowed from the hive on access
+    Cell { offset: u32, length: usize },
+    /// Data copied out of the hive (inline data, big data blocks)
+    Owned(Vec<u8>),
+}
+
+impl RawData {
+    /// Locate the raw bytes of `value`, copying only when they are not
+    /// contiguous in the hive
+    fn new(hive: &RustHive, value: &RustRegistryValue<'_>) -> crate::Result<Self> {
+        match value.data_cell() {
+            Some((offset, length)) => {
+                // Validate the cell once so later reads cannot fail
+                hive.read_cell_data(offset, length)?;
+                Ok(RawData::Cell { offset, length })
+            }
+            None => Ok(RawData::Owned(value.raw_data()?)),
+        }
+    }
+}
+
+/// Python buffer over the value data in a single cell of a hive
+///
+/// Exposes the data through the buffer protocol so `memoryview` can read
+/// value data straight from the (memory-mapped) hive without copying.
+#[pyclass(name = "HiveBuffer")]
+pub struct PyHiveBuffer {
+    hive: Py<PyHive>,
+    offset: u32,
+    length: usize,
+}
+
+#[pymethods]
+impl PyHiveBuffer {
+    unsafe fn __getbuffer__(
+        slf: &PyCell<Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+        
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("Hive data is read-only"));
+        }
+        
+        let this = slf.borrow();
+        let hive = this.hive.borrow(slf.py());
+        let data = hive.inner.read_cell_data(this.offset, this.length)
+            .map_err(registry_error_to_py)?;
+        
+        // The view keeps this object (and thus the hive data) alive
+        ffi::Py_INCREF(slf.as_ptr());
+        (*view).obj = slf.as_ptr();
+        
+        (*view).buf = data.as_ptr() as *mut c_void;
+        (*view).len = data.len() as isize;
+        (*view).readonly = 1;
+        (*view).itemsize = 1;
+        
+        (*view).format = if (flags & ffi::PyBUF_FORMAT) == ffi::PyBUF_FORMAT {
+            b"B\0".as_ptr() as *mut c_char
+        } else {
+            ptr::null_mut()
+        };
+        
+        (*view).ndim = 1;
+        (*view).shape = if (flags & ffi::PyBUF_ND) == ffi::PyBUF_ND {
+            &mut (*view).len
+        } else {
+            ptr::null_mut()
+        };
+        
+        (*view).strides = if (flags & ffi::PyBUF_STRIDES) == ffi::PyBUF_STRIDES {
+            &mut (*view).itemsize
+        } else {
+            ptr::null_mut()
+        };
+        
+        (*view).suboffsets = ptr::null_mut();
+        (*view).internal = ptr::null_mut();
+        
+        Ok(())
+    }
+
+    fn __len__(&self, py: Python) -> PyResult<usize> {
+        self.hive.borrow(py).inner
+            .read_cell_data(self.offset, self.length)
+            .map(|data| data.len())
+            .map_err(registry_error_to_py)
+    }
+}
+
+/// Name, type and data location of a value, gathered without the GIL
+struct ValueParts {
+    name: String,
+    data_type: RustValueType,
+    raw: RawData,
+}
+
+impl ValueParts {
+    /// Describe a Rust value without copying cell-backed data
+    fn new(hive: &RustHive, value: &RustRegistryValue<'_>) -> Self {
+        ValueParts {
+            name: value.name().to_string(),
+            data_type: value.data_type(),
+            // Fall back to empty data if it can't be read
+            // This ensures all values are returned, even if data can't be read
+            raw: RawData::new(hive, value).unwrap_or(RawData::Owned(Vec::new())),
+        }
+    }
+
+    /// Wrap the value for Python (with GIL held)
+    fn into_value(self, hive: Py<PyHive>) -> PyRegistryValue {
+        PyRegistryValue {
+            hive,
+            name: self.name,
+            data_type: self.data_type,
+            raw: self.raw,
+        }
+    }
+}
+
 /// Python wrapper for RegistryValue
 /// 
-/// Stores owned data to avoid lifetime issues with PyO3.
+/// Keeps a reference to the owning `Hive` object so cell-backed data is
+/// read in place instead of being copied when the value is created.
 #[pyclass(name = "RegistryValue")]
 pub struct PyRegistryValue {
+    hive: Py<PyHive>,
     name: String,
     data_type: RustValueType,
-    raw_data: Vec<u8>,
+    raw: RawData,
 }
 
 #[pymethods]
 impl PyRegistryValue {
     /// Get the value name
-    fn name(&self) -> &str {
-        &self.name
+    fn name(&self, py: Python) -> Py<PyString> {
+        self.hive.borrow(py).inner.names.get(py, &self.name)
     }
 
     /// Get the value type
@@ -363,20 +580,55 @@ impl PyRegistryValue {
     }
 
     /// Get the parsed value data
-    fn data(&self) -> PyResult<PyValueData> {
-        RustValueData::parse(&self.raw_data, self.data_type, 0)
-            .map(|d| PyValueData { inner: d })
-            .map_err(registry_error_to_py)
+    fn data(&self, py: Python) -> PyResult<PyValueData> {
+        let hive = self.hive.borrow(py);
+        let raw = self.raw_bytes(&hive.inner);
+        let data_type = self.data_type;
+        let parse = move || {
+            catch_unwind(AssertUnwindSafe(|| RustValueData::parse(raw, data_type, 0)))
+                .map_err(panic_to_py)?
+                .map_err(registry_error_to_py)
+        };
+        
+        // Release GIL while decoding large data; small values are faster
+        // to parse than the GIL round trip
+        let parsed = if raw.len() > GIL_RELEASE_MIN_DATA_SIZE {
+            py.allow_threads(parse)
+        } else {
+            parse()
+        }?;
+        
+        Ok(PyValueData { inner: parsed })
     }
 
     /// Get the raw value data as bytes
     fn raw_data<'py>(&self, py: Python<'py>) -> &'py PyBytes {
-        PyBytes::new(py, &self.raw_data)
+        let hive = self.hive.borrow(py);
+        PyBytes::new(py, self.raw_bytes(&hive.inner))
+    }
+
+    /// Get the raw value data as a read-only memoryview
+    ///
+    /// Data stored in a single hive cell is exposed without copying; other
+    /// data is wrapped in a bytes object first.
+    fn raw_buffer<'py>(&self, py: Python<'py>) -> PyResult<&'py PyMemoryView> {
+        match &self.raw {
+            RawData::Cell { offset, length } => {
+                let buffer = PyCell::new(py, PyHiveBuffer {
+                    hive: self.hive.clone_ref(py),
+                    offset: *offset,
+                    length: *length,
+                })?;
+                PyMemoryView::from(buffer)
+            }
+            RawData::Owned(data) => PyMemoryView::from(PyBytes::new(py, data)),
+        }
     }
 
     /// Get the data size in bytes
-    fn data_size(&self) -> usize {
-        self.raw_data.len()
+    fn data_size(&self, py: Python) -> usize {
+        let hive = self.hive.borrow(py);
+        self.raw_bytes(&hive.inner).len()
     }
 
     fn __repr__(&self) -> String {
@@ -384,87 +636,267 @@ impl PyRegistryValue {
     }
 }
 
+impl PyRegistryValue {
+    /// Borrow the raw value bytes from `hive`, the hive this value is in
+    fn raw_bytes<'a>(&'a self, hive: &'a RustHive) -> &'a [u8] {
+        match &self.raw {
+            // Validated in RawData::new and the hive data never changes
+            RawData::Cell { offset, length } => {
+                hive.read_cell_data(*offset, *length).unwrap_or_default()
+            }
+            RawData::Owned(data) => data,
+        }
+    }
+}
+
+/// Number of keys passed to a `walk` visitor per call
+const WALK_BATCH_SIZE: usize = 1024;
+
+/// Walk the tree under `root_offset` without the GIL, then hand the
+/// `(offset, parent_offset, name)` tuples to Python
+///
+/// Returns them as one list, or passes them to `visitor` in lists of up to
+/// `WALK_BATCH_SIZE` and returns `None`.
+fn walk_to_py(
+    py: Python<'_>,
+    hive: Arc<SharedHive>,
+    root_offset: u32,
+    visitor: Option<PyObject>,
+) -> PyResult<PyObject> {
+    // Release GIL during the (multi-threaded) walk with panic protection
+    let keys = py.allow_threads(move || {
+        catch_unwind(AssertUnwindSafe(|| hive.walk(root_offset)))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+    })?;
+    
+    // Most names in a walk are seen once, so they bypass the name cache
+    let to_list = |batch: &[WalkedKey]| {
+        PyList::new(py, batch.iter().map(|key| (key.offset, key.parent, PyString::new(py, &key.name))))
+    };
+    
+    match visitor {
+        Some(visitor) => {
+            for batch in keys.chunks(WALK_BATCH_SIZE) {
+                visitor.call1(py, (to_list(batch),))?;
+            }
+            Ok(py.None())
+        }
+        None => Ok(to_list(&keys).to_object(py)),
+    }
+}
+
+/// Case-insensitive prefix test for key names
+fn starts_with_ignore_case(name: &str, prefix: &str) -> bool {
+    if prefix.is_ascii() {
+        name.len() >= prefix.len()
+            && name.as_bytes()[..prefix.len()].eq_ignore_ascii_case(prefix.as_bytes())
+    } else {
+        name.to_uppercase().starts_with(&prefix.to_uppercase())
+    }
+}
+
 /// Python wrapper for RegistryKey
 /// 
-/// Stores Arc<Hive> and offset to avoid lifetime issues with PyO3.
+/// A lightweight handle holding only the owning `Hive` object and the key's
+/// cell offset. Key data is read from the hive's key cache on access, so
+/// creating a handle costs a single refcount increment on the `Hive`.
 #[pyclass(name = "RegistryKey")]
 pub struct PyRegistryKey {
-    hive: Arc<RustHive>,
+    hive: Py<PyHive>,
     offset: u32,
-    name: String,
-    subkey_count: u32,
-    value_count: u32,
 }
 
 #[pymethods]
 impl PyRegistryKey {
     /// Get the key name
-    fn name(&self) -> &str {
-        &self.name
+    fn name(&self, py: Python) -> PyResult<Py<PyString>> {
+        self.with_node(py, |hive, key_node| hive.names.get(py, &key_node.name))
+    }
+
+    /// Get the cell offset of this key
+    ///
+    /// Identifies the key within its hive; `Hive.key_at` turns it back into
+    /// a key.
+    fn offset(&self) -> u32 {
+        self.offset
     }
 
     /// Get the number of subkeys
-    fn subkey_count(&self) -> u32 {
-        self.subkey_count
+    fn subkey_count(&self, py: Python) -> PyResult<u32> {
+        self.with_node(py, |_, key_node| key_node.subkey_count)
     }
 
     /// Get the number of values
-    fn value_count(&self) -> u32 {
-        self.value_count
+    fn value_count(&self, py: Python) -> PyResult<u32> {
+        self.with_node(py, |_, key_node| key_node.value_count)
     }
 
-    /// Get all subkeys
-    fn subkeys(&self, py: Python) -> PyResult<Vec<PyRegistryKey>> {
-        let hive = Arc::clone(&self.hive);
+    /// Iterate over subkeys
+    ///
+    /// Only the subkey offsets are collected up front; each subkey is
+    /// parsed when the iterator reaches it.
+    fn subkeys(&self, py: Python) -> PyResult<PySubkeyIter> {
+        let hive = self.shared(py);
         let offset = self.offset;
         
         // Release GIL during Rust operations with panic protection
-        let subkeys_data = py.allow_threads(move || {
+        let offsets = py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                hive.get_key(offset)?.subkey_offsets()
+            }))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+        })?;
+        
+        Ok(PySubkeyIter {
+            hive: self.hive.clone_ref(py),
+            offsets,
+            index: 0,
+        })
+    }
+
+    /// Get all subkeys as a list
+    fn subkeys_list(&self, py: Python) -> PyResult<Vec<PyRegistryKey>> {
+        let hive = self.shared(py);
+        let offset = self.offset;
+        
+        // Release GIL during Rust operations with panic protection
+        let offsets = py.allow_threads(move || {
             // Catch any panics and convert to Python exceptions
             catch_unwind(AssertUnwindSafe(|| {
                 let key = hive.get_key(offset)?;
                 let subkeys = key.subkeys()?;
                 
+                Ok::<_, RegistryError>(subkeys.iter().map(|subkey| subkey.offset).collect::<Vec<_>>())
+            }))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+        })?;
+        
+        // Convert to Python objects (with GIL held)
+        Ok(offsets.into_iter().map(|offset| self.key_at(py, offset)).collect())
+    }
+
+    /// Get the subkey at position `index`
+    ///
+    /// Subkey offsets are cached on the key after the first call, so
+    /// positional access is constant time and ranges can be split across
+    /// threads.
+    fn subkey_at(&self, index: usize, py: Python) -> PyResult<PyRegistryKey> {
+        let hive = self.shared(py);
+        let offset = self.offset;
+        
+        // Release GIL during Rust operations with panic protection
+        let subkey_offset = py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                let key = hive.get_key(offset)?;
+                Ok::<_, RegistryError>(key.subkey_at(index)?.map(|subkey| subkey.offset))
+            }))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+        })?;
+        
+        subkey_offset
+            .map(|offset| self.key_at(py, offset))
+            .ok_or_else(|| PyIndexError::new_err("subkey index out of range"))
+    }
+
+    /// Get the subkeys whose names match a filter
+    ///
+    /// `prefix` is matched case-insensitively against the start of the
+    /// name; `regex` is searched anywhere in the name (use `(?i)` to ignore
+    /// case). When both are given a subkey must match both. Names are
+    /// matched in Rust against the cached key nodes without copying them,
+    /// so Python objects are only created for matches.
+    #[pyo3(signature = (prefix=None, regex=None))]
+    fn find_subkeys(
+        &self,
+        prefix: Option<&str>,
+        regex: Option<&str>,
+        py: Python,
+    ) -> PyResult<Vec<PyRegistryKey>> {
+        let pattern = regex
+            .map(Regex::new)
+            .transpose()
+            .map_err(|e| PyValueError::new_err(format!("Invalid regex: {}", e)))?;
+        
+        let hive = self.shared(py);
+        let offset = self.offset;
+        let prefix = prefix.map(str::to_string);
+        
+        // Release GIL during Rust operations with panic protection
+        let matches = py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                let is_match = |name: &str| {
+                    prefix.as_deref().map_or(true, |prefix| starts_with_ignore_case(name, prefix))
+                        && pattern.as_ref().map_or(true, |pattern| pattern.is_match(name))
+                };
+                
                 let mut result = Vec::new();
-                for subkey in subkeys {
-                    let name = subkey.name()?;
-                    let subkey_count = subkey.subkey_count()?;
-                    let value_count = subkey.value_count()?;
-                    
-                    result.push((subkey.offset, name, subkey_count, value_count));
+                for subkey_offset in hive.get_key(offset)?.subkey_offsets()? {
+                    if hive.with_key_node(subkey_offset, |key_node| is_match(&key_node.name))? {
+                        result.push(subkey_offset);
+                    }
                 }
                 
                 Ok::<_, RegistryError>(result)
             }))
-            .map_err(|panic_err| {
-                // Convert panic to Python exception
-                let panic_msg = if let Some(s) = panic_err.downcast_ref::<&str>() {
-                    format!("Rust panic: {}", s)
-                } else if let Some(s) = panic_err.downcast_ref::<String>() {
-                    format!("Rust panic: {}", s)
-                } else {
-                    "Rust panic: unknown error".to_string()
-                };
-                PyRuntimeError::new_err(panic_msg)
-            })?
+            .map_err(panic_to_py)?
             .map_err(registry_error_to_py)
         })?;
         
-        // Convert to Python objects (with GIL held)
-        Ok(subkeys_data.into_iter().map(|(offset, name, subkey_count, value_count)| {
-            PyRegistryKey {
-                hive: Arc::clone(&self.hive),
-                offset,
-                name,
-                subkey_count,
-                value_count,
-            }
-        }).collect())
+        Ok(matches.into_iter().map(|offset| self.key_at(py, offset)).collect())
     }
 
-    /// Get all values
-    fn values(&self, py: Python) -> PyResult<Vec<PyRegistryValue>> {
-        let hive = Arc::clone(&self.hive);
+    /// Get a direct subkey by name (case-insensitive)
+    ///
+    /// Uses the key's subkey index, which is built on the first lookup.
+    fn subkey(&self, name: &str, py: Python) -> PyResult<PyRegistryKey> {
+        let hive = self.shared(py);
+        let offset = self.offset;
+        let name_owned = name.to_string();
+        
+        // Release GIL during Rust operations with panic protection
+        let subkey_offset = py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                let key = hive.get_key(offset)?;
+                Ok::<_, RegistryError>(key.subkey_by_name(&name_owned)?.offset)
+            }))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+        })?;
+        
+        Ok(self.key_at(py, subkey_offset))
+    }
+
+    /// Iterate over values
+    ///
+    /// Only the value offsets are collected up front; each value is
+    /// parsed when the iterator reaches it.
+    fn values(&self, py: Python) -> PyResult<PyValueIter> {
+        let hive = self.shared(py);
+        let offset = self.offset;
+        
+        // Release GIL during Rust operations with panic protection
+        let offsets = py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                hive.get_key(offset)?.value_offsets()
+            }))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+        })?;
+        
+        Ok(PyValueIter {
+            hive: self.hive.clone_ref(py),
+            offsets,
+            index: 0,
+        })
+    }
+
+    /// Get all values as a list
+    fn values_list(&self, py: Python) -> PyResult<Vec<PyRegistryValue>> {
+        let hive = self.shared(py);
         let offset = self.offset;
         
         // Release GIL during Rust operations with panic protection
@@ -474,115 +906,231 @@ impl PyRegistryKey {
                 let key = hive.get_key(offset)?;
                 let values = key.values()?;
                 
-                let mut result = Vec::new();
-                for value in values {
-                    let name = value.name().to_string();
-                    let data_type = value.data_type();
-                    // Use unwrap_or_default to return empty vec if raw_data fails
-                    // This ensures all values are returned, even if data can't be read
-                    let raw_data = value.raw_data().unwrap_or_default();
-                    
-                    result.push((name, data_type, raw_data));
-                }
+                let result: Vec<_> = values
+                    .iter()
+                    .map(|value| ValueParts::new(&hive, value))
+                    .collect();
                 
                 Ok::<_, RegistryError>(result)
             }))
-            .map_err(|panic_err| {
-                let panic_msg = if let Some(s) = panic_err.downcast_ref::<&str>() {
-                    format!("Rust panic: {}", s)
-                } else if let Some(s) = panic_err.downcast_ref::<String>() {
-                    format!("Rust panic: {}", s)
-                } else {
-                    "Rust panic: unknown error".to_string()
-                };
-                PyRuntimeError::new_err(panic_msg)
-            })?
+            .map_err(panic_to_py)?
             .map_err(registry_error_to_py)
         })?;
         
         // Convert to Python objects (with GIL held)
-        Ok(values_data.into_iter().map(|(name, data_type, raw_data)| {
-            PyRegistryValue {
-                name,
-                data_type,
-                raw_data,
-            }
-        }).collect())
+        Ok(values_data
+            .into_iter()
+            .map(|parts| parts.into_value(self.hive.clone_ref(py)))
+            .collect())
+    }
+
+    /// Get the value at position `index`
+    ///
+    /// Value offsets are cached on the key after the first call, so
+    /// positional access is constant time.
+    fn value_at(&self, index: usize, py: Python) -> PyResult<PyRegistryValue> {
+        let hive = self.shared(py);
+        let offset = self.offset;
+        
+        // Release GIL during Rust operations with panic protection
+        let value = py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                let key = hive.get_key(offset)?;
+                let value = key.value_at(index)?;
+                
+                Ok::<_, RegistryError>(value.map(|value| ValueParts::new(&hive, &value)))
+            }))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)
+        })?;
+        
+        value
+            .map(|parts| parts.into_value(self.hive.clone_ref(py)))
+            .ok_or_else(|| PyIndexError::new_err("value index out of range"))
     }
 
     /// Get a specific value by name
     fn value(&self, name: &str, py: Python) -> PyResult<PyRegistryValue> {
-        let hive = Arc::clone(&self.hive);
+        let hive = self.shared(py);
         let offset = self.offset;
         let name_owned = name.to_string();
         
         // Release GIL during Rust operations with panic protection
-        let (value_name, data_type, raw_data) = py.allow_threads(move || {
+        let parts = py.allow_threads(move || {
             catch_unwind(AssertUnwindSafe(|| {
                 let key = hive.get_key(offset)?;
                 let value = key.value(&name_owned)?;
                 
-                let value_name = value.name().to_string();
-                let data_type = value.data_type();
-                let raw_data = value.raw_data()?;
-                
-                Ok::<_, RegistryError>((value_name, data_type, raw_data))
+                // Unlike listings, a value fetched by name reports bad data
+                Ok::<_, RegistryError>(ValueParts {
+                    name: value.name().to_string(),
+                    data_type: value.data_type(),
+                    raw: RawData::new(&hive, &value)?,
+                })
             }))
-            .map_err(|panic_err| {
-                let panic_msg = if let Some(s) = panic_err.downcast_ref::<&str>() {
-                    format!("Rust panic: {}", s)
-                } else if let Some(s) = panic_err.downcast_ref::<String>() {
-                    format!("Rust panic: {}", s)
-                } else {
-                    "Rust panic: unknown error".to_string()
-                };
-                PyRuntimeError::new_err(panic_msg)
-            })?
+            .map_err(panic_to_py)?
             .map_err(registry_error_to_py)
         })?;
         
-        Ok(PyRegistryValue {
-            name: value_name,
-            data_type,
-            raw_data,
-        })
+        Ok(parts.into_value(self.hive.clone_ref(py)))
+    }
+
+    /// Visit this key and all keys below it
+    ///
+    /// The tree is walked in parallel without the GIL. Returns a list of
+    /// `(offset, parent_offset, name)` tuples, or, with `visitor`, calls it
+    /// with lists of up to 1024 tuples and returns `None`. Every key comes
+    /// after its parent; `parent_offset` is `None` for this key.
+    #[pyo3(signature = (visitor=None))]
+    fn walk(&self, visitor: Option<PyObject>, py: Python) -> PyResult<PyObject> {
+        walk_to_py(py, self.shared(py), self.offset, visitor)
     }
 
     /// Get the last write timestamp as Unix timestamp (seconds since epoch)
-    fn last_written_timestamp(&self) -> PyResult<Option<i64>> {
-        // Note: Cannot use py.allow_threads() here due to RefCell in Hive not being Sync
-        // This is a quick operation so GIL impact is minimal
-        let key = self.hive.get_key(self.offset)
-            .map_err(registry_error_to_py)?;
-        let key_node = key.debug_key_node();
-        
+    fn last_written_timestamp(&self, py: Python) -> PyResult<Option<i64>> {
         // Convert Windows FILETIME to Unix timestamp
         // FILETIME is 100-nanosecond intervals since 1601-01-01
         // Unix epoch is 1970-01-01, difference is 11644473600 seconds
         const FILETIME_UNIX_DIFF: i64 = 11644473600;
         
-        if key_node.last_written == 0 {
+        // This is a quick cached lookup, so releasing the GIL would cost more
+        // than it saves
+        let last_written = self.with_node(py, |_, key_node| key_node.last_written)?;
+        
+        if last_written == 0 {
             return Ok(None);
         }
         
-        let seconds = (key_node.last_written / 10_000_000) as i64 - FILETIME_UNIX_DIFF;
+        let seconds = (last_written / 10_000_000) as i64 - FILETIME_UNIX_DIFF;
         Ok(Some(seconds))
     }
 
-    fn __repr__(&self) -> String {
-        format!(
-            "RegistryKey(name='{}', subkeys={}, values={})",
-            self.name,
-            self.subkey_count,
-            self.value_count
-        )
+    fn __repr__(&self, py: Python) -> PyResult<String> {
+        self.with_node(py, |_, key_node| {
+            format!(
+                "RegistryKey(name='{}', subkeys={}, values={})",
+                key_node.name,
+                key_node.subkey_count,
+                key_node.value_count
+            )
+        })
+    }
+}
+
+impl PyRegistryKey {
+    /// Shared Rust hive behind this key, for use without the GIL
+    fn shared(&self, py: Python<'_>) -> Arc<SharedHive> {
+        Arc::clone(&self.hive.borrow(py).inner)
+    }
+
+    /// Run `f` on this key's cached key node
+    fn with_node<R>(
+        &self,
+        py: Python<'_>,
+        f: impl FnOnce(&SharedHive, &RustKeyNode) -> R,
+    ) -> PyResult<R> {
+        let hive = self.hive.borrow(py);
+        catch_unwind(AssertUnwindSafe(|| {
+            hive.inner.with_key_node(self.offset, |key_node| f(&*hive.inner, key_node))
+        }))
+        .map_err(panic_to_py)?
+        .map_err(registry_error_to_py)
+    }
+
+    /// Handle for another key in the same hive
+    fn key_at(&self, py: Python<'_>, offset: u32) -> PyRegistryKey {
+        PyRegistryKey {
+            hive: self.hive.clone_ref(py),
+            offset,
+        }
+    }
+}
+
+/// Lazy iterator over the subkeys of a RegistryKey
+#[pyclass(name = "SubkeyIter")]
+pub struct PySubkeyIter {
+    hive: Py<PyHive>,
+    offsets: Vec<u32>,
+    index: usize,
+}
+
+#[pymethods]
+impl PySubkeyIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<PyRegistryKey>> {
+        if slf.index >= slf.offsets.len() {
+            return Ok(None);
+        }
+        
+        let offset = slf.offsets[slf.index];
+        slf.index += 1;
+        
+        // Parse (and cache) the key now so corrupt subkeys are reported here
+        let py = slf.py();
+        let hive = slf.hive.borrow(py);
+        catch_unwind(AssertUnwindSafe(|| hive.inner.with_key_node(offset, |_| ())))
+            .map_err(panic_to_py)?
+            .map_err(registry_error_to_py)?;
+        
+        Ok(Some(PyRegistryKey {
+            hive: slf.hive.clone_ref(py),
+            offset,
+        }))
+    }
+
+    /// Number of subkeys not yet yielded
+    fn __length_hint__(&self) -> usize {
+        self.offsets.len() - self.index
+    }
+}
+
+/// Lazy iterator over the values of a RegistryKey
+#[pyclass(name = "ValueIter")]
+pub struct PyValueIter {
+    hive: Py<PyHive>,
+    offsets: Vec<u32>,
+    index: usize,
+}
+
+#[pymethods]
+impl PyValueIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<PyRegistryValue>> {
+        if slf.index >= slf.offsets.len() {
+            return Ok(None);
+        }
+        
+        let offset = slf.offsets[slf.index];
+        slf.index += 1;
+        
+        let py = slf.py();
+        let hive = slf.hive.borrow(py);
+        let parts = catch_unwind(AssertUnwindSafe(|| {
+            let value = hive.inner.get_value(offset)?;
+            Ok::<_, RegistryError>(ValueParts::new(&hive.inner, &value))
+        }))
+        .map_err(panic_to_py)?
+        .map_err(registry_error_to_py)?;
+        
+        Ok(Some(parts.into_value(slf.hive.clone_ref(py))))
+    }
+
+    /// Number of values not yet yielded
+    fn __length_hint__(&self) -> usize {
+        self.offsets.len() - self.index
     }
 }
 
 /// Python wrapper for Hive
 #[pyclass(name = "Hive")]
 pub struct PyHive {
-    inner: Arc<RustHive>,
+    inner: Arc<SharedHive>,
 }
 
 #[pymethods]
@@ -595,7 +1143,7 @@ impl PyHive {
             RustHive::open(path)
         }).map_err(registry_error_to_py)?;
         
-        Ok(PyHive { inner: Arc::new(hive) })
+        Ok(PyHive { inner: Arc::new(SharedHive::new(hive)) })
     }
 
     /// Open a registry hive with transaction logs applied
@@ -611,43 +1159,65 @@ impl PyHive {
             RustHive::open_with_logs(hive_path, log1_path, log2_path)
         }).map_err(registry_error_to_py)?;
         
-        Ok(PyHive { inner: Arc::new(hive) })
+        Ok(PyHive { inner: Arc::new(SharedHive::new(hive)) })
     }
 
     /// Get the base block (header) information
-    fn base_block(&self) -> PyBaseBlock {
-        PyBaseBlock {
-            inner: self.inner.base_block().clone(),
-        }
+    fn base_block(&self, py: Python) -> PyResult<Py<PyBaseBlock>> {
+        PyBaseBlock::new_py(py, self.inner.base_block())
     }
 
     /// Get the root key of the hive
-    fn root_key(&self, py: Python) -> PyResult<PyRegistryKey> {
+    fn root_key(slf: PyRef<'_, Self>, py: Python) -> PyResult<PyRegistryKey> {
+        let hive = Arc::clone(&slf.inner);
+        
         // Release GIL during Rust operations
-        let (offset, name, subkey_count, value_count) = py.allow_threads(|| {
-            let key = self.inner.root_key()
-                .map_err(registry_error_to_py)?;
-            let name = key.name()
-                .map_err(registry_error_to_py)?;
-            let subkey_count = key.subkey_count()
-                .map_err(registry_error_to_py)?;
-            let value_count = key.value_count()
-                .map_err(registry_error_to_py)?;
-            
-            Ok::<_, PyErr>((key.offset, name, subkey_count, value_count))
+        let offset = py.allow_threads(move || {
+            hive.root_key().map(|key| key.offset)
+        }).map_err(registry_error_to_py)?;
+        
+        Ok(PyRegistryKey {
+            hive: slf.into(),
+            offset,
+        })
+    }
+
+    /// Get the key at a cell offset
+    ///
+    /// Offsets come from `RegistryKey.offset()` and `walk`. The key is
+    /// parsed (and cached) here, so a bad offset is reported right away.
+    fn key_at(slf: PyRef<'_, Self>, offset: u32, py: Python) -> PyResult<PyRegistryKey> {
+        let hive = Arc::clone(&slf.inner);
+        
+        // Release GIL during Rust operations with panic protection
+        py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| hive.with_key_node(offset, |_| ())))
+                .map_err(panic_to_py)?
+                .map_err(registry_error_to_py)
         })?;
         
         Ok(PyRegistryKey {
-            hive: Arc::clone(&self.inner),
+            hive: slf.into(),
             offset,
-            name,
-            subkey_count,
-            value_count,
         })
     }
 
+    /// Visit every key under `root_offset` (the root key by default)
+    ///
+    /// See `RegistryKey.walk`.
+    #[pyo3(signature = (root_offset=None, visitor=None))]
+    fn walk(
+        &self,
+        root_offset: Option<u32>,
+        visitor: Option<PyObject>,
+        py: Python,
+    ) -> PyResult<PyObject> {
+        let root_offset = root_offset.unwrap_or(self.inner.base_block().root_cell_offset);
+        walk_to_py(py, Arc::clone(&self.inner), root_offset, visitor)
+    }
+
     /// Get all hbin headers
-    fn hbins(&self, py: Python) -> PyResult<Vec<PyHbinHeader>> {
+    fn hbins(&self, py: Python) -> PyResult<Vec<Py<PyHbinHeader>>> {
         // Release GIL during iteration
         let hbins = py.allow_threads(|| {
             let mut result = Vec::new();
@@ -658,7 +1228,31 @@ impl PyHive {
             Ok::<_, PyErr>(result)
         })?;
         
-        Ok(hbins.into_iter().map(|h| PyHbinHeader { inner: h }).collect())
+        hbins.iter().map(|h| PyHbinHeader::new_py(py, h)).collect()
+    }
+
+    /// Find every cell with a 2-character signature (e.g. "nk") in all hbins
+    ///
+    /// The hbin data is scanned directly, without the GIL, so cells in free
+    /// space (deleted keys and values) and in damaged hbins are found too.
+    /// Returns `(offset, size, is_allocated)` tuples; `nk` offsets can be
+    /// opened with `key_at`.
+    fn find_cells(&self, signature: &str, py: Python) -> PyResult<Vec<(u32, u32, bool)>> {
+        let signature: [u8; 2] = signature.as_bytes().try_into().map_err(|_| {
+            PyValueError::new_err(format!("Cell signature must be 2 bytes, got {:?}", signature))
+        })?;
+        let hive = Arc::clone(&self.inner);
+        
+        // Release GIL during the scan with panic protection
+        py.allow_threads(move || {
+            catch_unwind(AssertUnwindSafe(|| {
+                hive.find_cells(&signature)
+                    .iter()
+                    .map(|cell| (cell.offset, cell.size, cell.is_allocated))
+                    .collect()
+            }))
+            .map_err(panic_to_py)
+        })
     }
 
     /// Save the hive to a file
@@ -684,6 +1278,9 @@ fn regrs(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<PyHive>()?;
     m.add_class::<PyRegistryKey>()?;
     m.add_class::<PyRegistryValue>()?;
+    m.add_class::<PyHiveBuffer>()?;
+    m.add_class::<PySubkeyIter>()?;
+    m.add_class::<PyValueIter>()?;
     m.add_class::<PyValueData>()?;
     m.add_class::<PyValueType>()?;
     m.add_class::<PyBaseBlock>()?;
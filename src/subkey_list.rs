@@ -4,7 +4,6 @@
 //! list structures for efficient lookup.
 
 use crate::error::{RegistryError, Result};
-use crate::utils::read_u32_le;
 
 /// Subkey list types.
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -91,11 +90,7 @@ impl SubkeyList {
                     });
                 }
 
-                let mut offsets = Vec::with_capacity(count);
-                for i in 0..count {
-                    let offset_pos = 4 + (i * 4);
-                    offsets.push(read_u32_le(data, offset_pos)?);
-                }
+                let offsets = read_offsets(&data[4..expected_size]);
 
                 Ok(SubkeyList::IndexLeaf(offsets))
             }
@@ -112,17 +107,14 @@ impl SubkeyList {
                     });
                 }
 
-                let mut entries = Vec::with_capacity(count);
-                for i in 0..count {
-                    let entry_pos = 4 + (i * 8);
-                    let key_offset = read_u32_le(data, entry_pos)?;
-                    let name_hint = read_u32_le(data, entry_pos + 4)?;
-                    
-                    entries.push(SubkeyListEntry {
-                        key_offset,
-                        name_hint,
-                    });
-                }
+                // The whole entry array was bounds checked above
+                let entries = data[4..expected_size]
+                    .chunks_exact(8)
+                    .map(|entry| SubkeyListEntry {
+                        key_offset: u32::from_le_bytes([entry[0], entry[1], entry[2], entry[3]]),
+                        name_hint: u32::from_le_bytes([entry[4], entry[5], entry[6], entry[7]]),
+                    })
+                    .collect();
 
                 Ok(SubkeyList::LeafWithHints(entries))
             }
@@ -138,11 +130,7 @@ impl SubkeyList {
                     });
                 }
 
-                let mut offsets = Vec::with_capacity(count);
-                for i in 0..count {
-                    let offset_pos = 4 + (i * 4);
-                    offsets.push(read_u32_le(data, offset_pos)?);
-                }
+                let offsets = read_offsets(&data[4..expected_size]);
 
                 Ok(SubkeyList::IndexRoot(offsets))
             }
@@ -206,6 +194,197 @@ impl SubkeyList {
     }
 }
 
+/// Reads a bounds-checked array of little-endian cell offsets.
+fn read_offsets(data: &[u8]) -> Vec<u32> {
+    data.chunks_exact(4)
+        .map(|offset| u32::from_le_bytes([offset[0], offset[1], offset[2], offset[3]]))
+        .collect()
+}
+
+/// Computes the `lh` name hash of a key name.
+///
+/// The hash is built from the upper-cased UTF-16 code units of the name:
+/// `hash = hash * 37 + unit`. Windows upper-cases with its own table, so for
+/// non-ASCII names the result may differ from the hash stored on disk.
+pub fn name_hash(name: &str) -> u32 {
+    let mut hash: u32 = 0;
+    for c in name.chars().flat_map(char::to_uppercase) {
+        let mut units = [0u16; 2];
+        for unit in c.encode_utf16(&mut units) {
+            hash = hash.wrapping_mul(37).wrapping_add(u32::from(*unit));
+        }
+    }
+    hash
+}
+
+/// Search index over the subkeys of a single key.
+///
+/// Holds `(name_hash, key_offset)` pairs in a complete binary search tree
+/// stored in van Emde Boas order: each subtree is split at half its height
+/// and the top half is laid out before the bottom subtrees, recursively.
+/// The nodes visited by a lookup are then clustered in as few cache lines
+/// as possible whatever the cache size, which is what makes lookups in
+/// large indexes cheap compared with their on-disk order.
+#[derive(Debug, Clone, Default)]
+pub struct SubkeyIndex {
+    /// Tree nodes in vEB order, padded to a perfect tree.
+    nodes: Vec<(u32, u32)>,
+    
+    /// Number of real (non-padding) entries.
+    len: usize,
+    
+    /// Tree height (0 for an empty index).
+    height: usize,
+    
+    /// Per depth: depth of the root of the enclosing top tree.
+    top_depth: Vec<usize>,
+    
+    /// Per depth: size of the enclosing top tree (also the mask selecting
+    /// which bottom tree a node belongs to).
+    top_size: Vec<usize>,
+    
+    /// Per depth: size of each bottom tree rooted at this depth.
+    bottom_size: Vec<usize>,
+}
+
+/// Marker for padding nodes; never a valid cell offset.
+const PADDING_OFFSET: u32 = 0xFFFFFFFF;
+
+impl SubkeyIndex {
+    /// Builds an index from `(name_hash, key_offset)` pairs in any order.
+    pub fn new(mut entries: Vec<(u32, u32)>) -> Self {
+        entries.sort_unstable();
+        
+        let len = entries.len();
+        let height = (usize::BITS - len.leading_zeros()) as usize;
+        let size = (1usize << height) - 1;
+        
+        // Padding sorts after every real entry
+        entries.resize(size, (u32::MAX, PADDING_OFFSET));
+        
+        let mut index = SubkeyIndex {
+            nodes: Vec::with_capacity(size),
+            len,
+            height,
+            top_depth: vec![0; height],
+            top_size: vec![0; height],
+            bottom_size: vec![0; height],
+        };
+        
+        if height > 0 {
+            index.split(0, height);
+            index.layout(1, 0, height, &entries);
+        }
+        
+        index
+    }
+
+    /// Returns the number of entries in the index.
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    /// Returns true if the index is empty.
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    /// Returns the offsets of all keys whose name hash is `hash`.
+    ///
+    /// Hashes can collide, so callers still have to compare names.
+    pub fn find(&self, hash: u32) -> impl Iterator<Item = u32> + '_ {
+        (self.lower_bound(hash)..self.len)
+            .map(move |rank| self.nodes[self.position_of_rank(rank)])
+            .take_while(move |&(node_hash, _)| node_hash == hash)
+            .map(|(_, offset)| offset)
+    }
+
+    /// Records the vEB decomposition of the subtree spanning `height`
+    /// levels from `depth`.
+    fn split(&mut self, depth: usize, height: usize) {
+        if height == 1 {
+            return;
+        }
+        
+        let bottom_height = height / 2;
+        let top_height = height - bottom_height;
+        let bottom_depth = depth + top_height;
+        
+        self.top_depth[bottom_depth] = depth;
+        self.top_size[bottom_depth] = (1 << top_height) - 1;
+        self.bottom_size[bottom_depth] = (1 << bottom_height) - 1;
+        
+        self.split(depth, top_height);
+        self.split(bottom_depth, bottom_height);
+    }
+
+    /// Appends the subtree rooted at BFS index `bfs` in vEB order.
+    fn layout(&mut self, bfs: usize, depth: usize, height: usize, sorted: &[(u32, u32)]) {
+        if height == 1 {
+            self.nodes.push(sorted[self.rank(bfs, depth)]);
+            return;
+        }
+        
+        let bottom_height = height / 2;
+        let top_height = height - bottom_height;
+        
+        self.layout(bfs, depth, top_height, sorted);
+        for child in (bfs << top_height)..((bfs + 1) << top_height) {
+            self.layout(child, depth + top_height, bottom_height, sorted);
+        }
+    }
+
+    /// In-order rank of the node with 1-based BFS index `bfs` at `depth`.
+    fn rank(&self, bfs: usize, depth: usize) -> usize {
+        ((((bfs - (1 << depth)) << 1) | 1) << (self.height - 1 - depth)) - 1
+    }
+
+    /// Position in `nodes` of the node with 1-based BFS index `bfs` at `depth`.
+    fn position(&self, bfs: usize, depth: usize) -> usize {
+        let mut positions = [0usize; usize::BITS as usize];
+        for d in 1..=depth {
+            let ancestor = bfs >> (depth - d);
+            positions[d] = positions[self.top_depth[d]]
+                + self.top_size[d]
+                + (ancestor & self.top_size[d]) * self.bottom_size[d];
+        }
+        positions[depth]
+    }
+
+    /// Position in `nodes` of the entry with in-order rank `rank`.
+    fn position_of_rank(&self, rank: usize) -> usize {
+        let trailing = (rank + 1).trailing_zeros() as usize;
+        let depth = self.height - 1 - trailing;
+        let bfs = (1 << depth) | ((rank + 1) >> (trailing + 1));
+        self.position(bfs, depth)
+    }
+
+    /// Rank of the first entry whose hash is not less than `hash`.
+    fn lower_bound(&self, hash: u32) -> usize {
+        let mut positions = [0usize; usize::BITS as usize];
+        let mut bfs = 1;
+        let mut result = self.len;
+        
+        for depth in 0..self.height {
+            if depth > 0 {
+                positions[depth] = positions[self.top_depth[depth]]
+                    + self.top_size[depth]
+                    + (bfs & self.top_size[depth]) * self.bottom_size[depth];
+            }
+            
+            let (node_hash, _) = self.nodes[positions[depth]];
+            if hash <= node_hash {
+                result = self.rank(bfs, depth);
+                bfs <<= 1;
+            } else {
+                bfs = (bfs << 1) | 1;
+            }
+        }
+        
+        result.min(self.len)
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -235,4 +414,44 @@ mod tests {
         let result = SubkeyListType::from_signature(b"XX");
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_name_hash() {
+        assert_eq!(name_hash(""), 0);
+        assert_eq!(name_hash("a"), 'A' as u32);
+        assert_eq!(name_hash("Ab"), ('A' as u32) * 37 + 'B' as u32);
+        assert_eq!(name_hash("software"), name_hash("SOFTWARE"));
+    }
+
+    #[test]
+    fn test_subkey_index_layout() {
+        for count in 0..70u32 {
+            let entries: Vec<(u32, u32)> = (0..count).map(|i| (i * 7 % 23, 0x20 + i * 8)).collect();
+            let index = SubkeyIndex::new(entries.clone());
+            assert_eq!(index.len(), entries.len());
+            
+            let mut sorted = entries.clone();
+            sorted.sort_unstable();
+            for (rank, entry) in sorted.iter().enumerate() {
+                assert_eq!(index.nodes[index.position_of_rank(rank)], *entry);
+            }
+            
+            for hash in 0..25 {
+                let mut expected: Vec<u32> = entries.iter()
+                    .filter(|(h, _)| *h == hash)
+                    .map(|(_, offset)| *offset)
+                    .collect();
+                expected.sort_unstable();
+                let found: Vec<u32> = index.find(hash).collect();
+                assert_eq!(found, expected, "count {} hash {}", count, hash);
+            }
+        }
+    }
+
+    #[test]
+    fn test_subkey_index_max_hash() {
+        let index = SubkeyIndex::new(vec![(u32::MAX, 0x20), (1, 0x40)]);
+        assert_eq!(index.find(u32::MAX).collect::<Vec<_>>(), vec![0x20]);
+        assert!(index.find(2).next().is_none());
+    }
 }
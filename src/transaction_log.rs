@@ -6,8 +6,8 @@
 
 use crate::error::{RegistryError, Result};
 use crate::utils::read_u32_le;
+use memmap2::Mmap;
 use std::fs::File;
-use std::io::Read;
 use std::path::Path;
 
 /// Size of a dirty page in the transaction log.
@@ -68,11 +68,21 @@ impl TransactionLog {
     /// - File is not a valid transaction log
     /// - Log is corrupted
     pub fn open<P: AsRef<Path>>(path: P) -> Result<Self> {
-        let mut file = File::open(path)?;
-        let mut data = Vec::new();
-        file.read_to_end(&mut data)?;
+        let file = File::open(path)?;
         
-        Self::parse(&data)
+        // Empty or truncated logs are common; reject them before mapping
+        // (zero-length files cannot be memory-mapped on every platform)
+        if (file.metadata()?.len() as usize) < PAGE_SIZE {
+            return Err(RegistryError::InvalidFormat(
+                "Transaction log too small".to_string(),
+            ));
+        }
+        
+        // SAFETY: The log is opened read-only and only borrowed for the
+        // duration of parse(), which copies dirty pages into owned buffers.
+        let mmap = unsafe { Mmap::map(&file)? };
+        
+        Self::parse(&mmap)
     }
 
     /// Parses transaction log data from raw bytes.
@@ -285,22 +295,19 @@ pub fn apply_transaction_logs(hive_data: &mut Vec<u8>, logs: &[TransactionLog])
     Ok(total_applied)
 }
 
-/// Merges hive data with transaction logs from .LOG1 and .LOG2 files.
+/// Loads the .LOG1 and .LOG2 transaction logs that can be parsed.
+///
+/// Missing or invalid logs are skipped, matching how Windows treats absent
+/// log files.
 ///
 /// # Arguments
 ///
-/// * `hive_data` - Mutable reference to the base hive data.
 /// * `log1_path` - Optional path to .LOG1 file.
 /// * `log2_path` - Optional path to .LOG2 file.
-///
-/// # Returns
-///
-/// Returns the total number of dirty pages applied.
-pub fn merge_transaction_logs<P: AsRef<Path>>(
-    hive_data: &mut Vec<u8>,
+pub fn load_transaction_logs<P: AsRef<Path>>(
     log1_path: Option<P>,
     log2_path: Option<P>,
-) -> Result<usize> {
+) -> Vec<TransactionLog> {
     let mut logs = Vec::new();
 
     if let Some(path) = log1_path {
@@ -321,6 +328,27 @@ pub fn merge_transaction_logs<P: AsRef<Path>>(
         }
     }
 
+    logs
+}
+
+/// Merges hive data with transaction logs from .LOG1 and .LOG2 files.
+///
+/// # Arguments
+///
+/// * `hive_data` - Mutable reference to the base hive data.
+/// * `log1_path` - Optional path to .LOG1 file.
+/// * `log2_path` - Optional path to .LOG2 file.
+///
+/// # Returns
+///
+/// Returns the total number of dirty pages applied.
+pub fn merge_transaction_logs<P: AsRef<Path>>(
+    hive_data: &mut Vec<u8>,
+    log1_path: Option<P>,
+    log2_path: Option<P>,
+) -> Result<usize> {
+    let logs = load_transaction_logs(log1_path, log2_path);
+
     if logs.is_empty() {
         return Ok(0);
     }
@@ -374,6 +402,12 @@ mod tests {
         assert!(result.is_err());
     }
 
+    #[test]
+    fn test_load_skips_missing_logs() {
+        let logs = load_transaction_logs(Some("nonexistent.LOG1"), Some("nonexistent.LOG2"));
+        assert!(logs.is_empty());
+    }
+
     #[test]
     fn test_overflow_protection() {
         let mut hive_data = vec![0u8; 0x2000];
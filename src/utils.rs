@@ -1,9 +1,8 @@
 //! Utility functions for binary parsing and string conversion.
 
 use crate::error::{RegistryError, Result};
-use byteorder::{LittleEndian, ReadBytesExt};
 use encoding_rs::UTF_16LE;
-use std::io::Cursor;
+use std::borrow::Cow;
 
 /// Offset where hive bins start (after base block)
 pub const HBIN_START_OFFSET: u32 = 0x1000;
@@ -20,8 +19,11 @@ pub fn read_ascii_string(data: &[u8]) -> String {
 
 /// Reads a UTF-16LE string from a byte slice, trimming null terminators.
 /// 
-/// Registry strings are typically null-terminated. This function decodes
-/// UTF-16LE data and removes trailing null characters.
+/// Registry strings are typically null-terminated. This function removes
+/// trailing null code units and decodes the rest as UTF-16LE in a single
+/// pass, so the decoded string is returned without a second copy. No BOM
+/// sniffing is done: registry strings never carry one, and a leading
+/// U+FEFF is kept as part of the string.
 /// 
 /// # Errors
 /// 
@@ -37,14 +39,16 @@ pub fn read_utf16_string(data: &[u8], offset: u32) -> Result<String> {
         return Err(RegistryError::InvalidUtf16 { offset });
     }
 
-    let (decoded, _encoding, had_errors) = UTF_16LE.decode(data);
-    
-    if had_errors {
-        return Err(RegistryError::InvalidUtf16 { offset });
+    // Trim null terminators (common in registry strings) before decoding
+    let mut end = data.len();
+    while end >= 2 && data[end - 2] == 0 && data[end - 1] == 0 {
+        end -= 2;
     }
 
-    // Trim null terminators (common in registry strings)
-    Ok(decoded.trim_end_matches('\0').to_string())
+    UTF_16LE
+        .decode_without_bom_handling_and_without_replacement(&data[..end])
+        .map(Cow::into_owned)
+        .ok_or(RegistryError::InvalidUtf16 { offset })
 }
 
 /// Reads a fixed-length ASCII string (not null-terminated).
@@ -67,8 +71,7 @@ pub fn read_u32_le(data: &[u8], offset: usize) -> Result<u32> {
         });
     }
     
-    let mut cursor = Cursor::new(&data[offset..offset + 4]);
-    Ok(cursor.read_u32::<LittleEndian>()?)
+    Ok(u32::from_le_bytes([data[offset], data[offset + 1], data[offset + 2], data[offset + 3]]))
 }
 
 /// Reads a u16 from a byte slice at the given offset.
@@ -81,8 +84,7 @@ pub fn read_u16_le(data: &[u8], offset: usize) -> Result<u16> {
         });
     }
     
-    let mut cursor = Cursor::new(&data[offset..offset + 2]);
-    Ok(cursor.read_u16::<LittleEndian>()?)
+    Ok(u16::from_le_bytes([data[offset], data[offset + 1]]))
 }
 
 /// Reads an i32 from a byte slice at the given offset.
@@ -95,8 +97,39 @@ pub fn read_i32_le(data: &[u8], offset: usize) -> Result<i32> {
         });
     }
     
-    let mut cursor = Cursor::new(&data[offset..offset + 4]);
-    Ok(cursor.read_i32::<LittleEndian>()?)
+    Ok(i32::from_le_bytes([data[offset], data[offset + 1], data[offset + 2], data[offset + 3]]))
+}
+
+/// Borrows the first `N` bytes of `data` as a fixed-size record.
+///
+/// Fixed-layout structures (key and value headers) are bounds checked once
+/// here; fields are then read with [`record_u16`] and [`record_u32`], whose
+/// constant positions let the compiler drop the per-field checks.
+///
+/// # Errors
+///
+/// Returns `RegistryError::TruncatedData` if `data` is shorter than `N`.
+#[inline]
+pub fn read_record<const N: usize>(data: &[u8], offset: u32) -> Result<&[u8; N]> {
+    data.get(..N)
+        .and_then(|record| record.try_into().ok())
+        .ok_or(RegistryError::TruncatedData {
+            offset,
+            expected: N,
+            actual: data.len(),
+        })
+}
+
+/// Reads a little-endian u16 at `pos` in a fixed-size record.
+#[inline(always)]
+pub fn record_u16<const N: usize>(record: &[u8; N], pos: usize) -> u16 {
+    u16::from_le_bytes([record[pos], record[pos + 1]])
+}
+
+/// Reads a little-endian u32 at `pos` in a fixed-size record.
+#[inline(always)]
+pub fn record_u32<const N: usize>(record: &[u8; N], pos: usize) -> u32 {
+    u32::from_le_bytes([record[pos], record[pos + 1], record[pos + 2], record[pos + 3]])
 }
 
 /// Calculates XOR checksum for the first 508 bytes of the base block.
@@ -135,7 +168,7 @@ pub fn calculate_checksum(data: &[u8]) -> u32 {
 pub fn cell_offset_to_absolute(cell_offset: u32) -> Result<u32> {
     cell_offset
         .checked_add(HBIN_START_OFFSET)
-        .ok_or_else(|| RegistryError::InvalidOffset {
+        .ok_or(RegistryError::InvalidOffset {
             offset: cell_offset,
             hive_size: 0,  // Not known at this point
         })
@@ -186,6 +219,28 @@ mod tests {
         assert_eq!(read_ascii_string(data), "Hello\0World");
     }
 
+    #[test]
+    fn test_read_utf16_string() {
+        // "Key" followed by two null terminators
+        let data = [b'K', 0, b'e', 0, b'y', 0, 0, 0, 0, 0];
+        assert_eq!(read_utf16_string(&data, 0).unwrap(), "Key");
+        
+        // Embedded nulls are preserved, only trailing ones are trimmed
+        let data = [b'a', 0, 0, 0, b'b', 0, 0, 0];
+        assert_eq!(read_utf16_string(&data, 0).unwrap(), "a\0b");
+        
+        assert_eq!(read_utf16_string(&[0, 0], 0).unwrap(), "");
+    }
+
+    #[test]
+    fn test_read_utf16_string_invalid() {
+        // Odd length
+        assert!(read_utf16_string(&[b'a', 0, b'b'], 0).is_err());
+        
+        // Unpaired high surrogate
+        assert!(read_utf16_string(&[0x00, 0xD8, b'a', 0], 0).is_err());
+    }
+
     #[test]
     fn test_read_fixed_ascii() {
         let data = b"Test    ";
@@ -228,4 +283,14 @@ mod tests {
         let data = [0x01, 0x02, 0x03, 0x04];
         assert_eq!(read_u32_le(&data, 0).unwrap(), 0x04030201);
     }
+
+    #[test]
+    fn test_read_record() {
+        let data = [0x01, 0x02, 0x03, 0x04, 0x05, 0x06];
+        let record = read_record::<6>(&data, 0).unwrap();
+        assert_eq!(record_u16(record, 0), 0x0201);
+        assert_eq!(record_u32(record, 2), 0x06050403);
+        
+        assert!(read_record::<7>(&data, 0).is_err());
+    }
 }
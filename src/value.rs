@@ -2,9 +2,11 @@
 
 use crate::cell::ValueType;
 use crate::error::{RegistryError, Result};
-use crate::utils::{read_ascii_string, read_i32_le, read_u16_le, read_u32_le, read_utf16_string};
-use byteorder::{BigEndian, LittleEndian, ReadBytesExt};
-use std::io::Cursor;
+use crate::utils::{read_ascii_string, read_record, read_utf16_string, record_u16, record_u32};
+use std::fmt;
+
+/// Minimum size of a value key structure in bytes.
+const VALUE_KEY_MIN_SIZE: usize = 20;
 
 /// Value key (vk) structure.
 ///
@@ -42,32 +44,27 @@ impl ValueKey {
     ///
     /// Returns an error if the data is malformed or truncated.
     pub fn parse(data: &[u8], offset: u32) -> Result<Self> {
-        if data.len() < 20 {
-            return Err(RegistryError::TruncatedData {
-                offset,
-                expected: 20,
-                actual: data.len(),
-            });
-        }
+        // Fixed-size header; checked once, then fields are read in place
+        let record = read_record::<VALUE_KEY_MIN_SIZE>(data, offset)?;
 
         // Verify signature
-        if &data[0..2] != b"vk" {
+        if &record[0..2] != b"vk" {
             return Err(RegistryError::InvalidFormat(format!(
                 "Expected 'vk' signature at offset {:#x}",
                 offset
             )));
         }
 
-        let name_length = read_u16_le(data, 0x02)?;
+        let name_length = record_u16(record, 0x02);
         
         // Data length is stored as i32, with high bit indicating inline data
-        let data_length_raw = read_i32_le(data, 0x04)?;
-        let data_length = (data_length_raw & 0x7FFFFFFF) as u32;
+        let data_length_raw = record_u32(record, 0x04);
+        let data_length = data_length_raw & 0x7FFFFFFF;
         
-        let data_offset = read_u32_le(data, 0x08)?;
-        let data_type_raw = read_u32_le(data, 0x0C)?;
+        let data_offset = record_u32(record, 0x08);
+        let data_type_raw = record_u32(record, 0x0C);
         let data_type = ValueType::from_u32(data_type_raw)?;
-        let flags = read_u16_le(data, 0x10)?;
+        let flags = record_u16(record, 0x10);
         
         // Spare field at 0x12 (2 bytes) - unused
         
@@ -183,9 +180,8 @@ impl ValueData {
                         actual: data.len(),
                     });
                 }
-                let mut cursor = Cursor::new(data);
-                let value = cursor.read_u32::<LittleEndian>()?;
-                Ok(ValueData::Dword(value))
+                let bytes = data[..4].try_into().expect("length checked above");
+                Ok(ValueData::Dword(u32::from_le_bytes(bytes)))
             }
             
             ValueType::DwordBigEndian => {
@@ -196,9 +192,8 @@ impl ValueData {
                         actual: data.len(),
                     });
                 }
-                let mut cursor = Cursor::new(data);
-                let value = cursor.read_u32::<BigEndian>()?;
-                Ok(ValueData::DwordBigEndian(value))
+                let bytes = data[..4].try_into().expect("length checked above");
+                Ok(ValueData::DwordBigEndian(u32::from_be_bytes(bytes)))
             }
             
             ValueType::Qword => {
@@ -209,9 +204,8 @@ impl ValueData {
                         actual: data.len(),
                     });
                 }
-                let mut cursor = Cursor::new(data);
-                let value = cursor.read_u64::<LittleEndian>()?;
-                Ok(ValueData::Qword(value))
+                let bytes = data[..8].try_into().expect("length checked above");
+                Ok(ValueData::Qword(u64::from_le_bytes(bytes)))
             }
             
             ValueType::MultiString => {
@@ -228,18 +222,20 @@ impl ValueData {
             _ => Ok(ValueData::Unknown(data.to_vec())),
         }
     }
+}
 
-    /// Converts the value data to a string representation.
-    pub fn to_string(&self) -> String {
+/// Formats the value data as a string.
+impl fmt::Display for ValueData {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
         match self {
-            ValueData::None => String::from("(none)"),
-            ValueData::String(s) | ValueData::ExpandString(s) => s.clone(),
-            ValueData::Binary(b) => format!("{:02X?}", b),
-            ValueData::Dword(d) => format!("{} (0x{:08X})", d, d),
-            ValueData::DwordBigEndian(d) => format!("{} (0x{:08X})", d, d),
-            ValueData::Qword(q) => format!("{} (0x{:016X})", q, q),
-            ValueData::MultiString(strings) => strings.join(", "),
-            ValueData::Unknown(b) => format!("{:02X?}", b),
+            ValueData::None => f.write_str("(none)"),
+            ValueData::String(s) | ValueData::ExpandString(s) => f.write_str(s),
+            ValueData::Binary(b) => write!(f, "{:02X?}", b),
+            ValueData::Dword(d) => write!(f, "{} (0x{:08X})", d, d),
+            ValueData::DwordBigEndian(d) => write!(f, "{} (0x{:08X})", d, d),
+            ValueData::Qword(q) => write!(f, "{} (0x{:016X})", q, q),
+            ValueData::MultiString(strings) => f.write_str(&strings.join(", ")),
+            ValueData::Unknown(b) => write!(f, "{:02X?}", b),
         }
     }
 }
@@ -3,7 +3,7 @@
 //! This test suite collects metrics from our Rust parser that can be compared
 //! against other implementations (e.g., regipy).
 
-use reg_parser::{Hive, RegistryKey};
+use regrs::{Hive, RegistryKey};
 use serde::{Deserialize, Serialize};
 use std::fs::File;
 use std::io::Write;
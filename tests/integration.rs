@@ -1,6 +1,6 @@
 //! Integration tests using real registry hive files.
 
-use reg_parser::{Hive, ValueData};
+use regrs::{Hive, ValueData};
 use std::path::PathBuf;
 
 fn test_data_path(filename: &str) -> PathBuf {
@@ -124,6 +124,69 @@ fn test_enumerate_subkeys_system() {
     }
 }
 
+#[test]
+fn test_get_keys_batch_matches_get_key() {
+    let path = test_data_path("SYSTEM");
+    let hive = Hive::open(&path).expect("Failed to open SYSTEM hive");
+    
+    let root = hive.root_key().expect("Failed to get root key");
+    let offsets: Vec<u32> = root
+        .subkeys()
+        .expect("Failed to get subkeys")
+        .iter()
+        .map(|k| k.offset)
+        .rev()
+        .collect();
+    
+    let batch = hive.get_keys(&offsets).expect("Failed to get keys in batch");
+    assert_eq!(batch.len(), offsets.len());
+    
+    for (key, offset) in batch.iter().zip(&offsets) {
+        let single = hive.get_key(*offset).expect("Failed to get key");
+        assert_eq!(key.offset, *offset);
+        assert_eq!(key.name().unwrap(), single.name().unwrap());
+    }
+}
+
+#[test]
+fn test_subkey_by_name_system() {
+    let path = test_data_path("SYSTEM");
+    let hive = Hive::open(&path).expect("Failed to open SYSTEM hive");
+    
+    let root = hive.root_key().expect("Failed to get root key");
+    for subkey in root.subkeys().expect("Failed to get subkeys") {
+        let name = subkey.name().unwrap();
+        
+        let found = root.subkey_by_name(&name).expect("Failed to find subkey by name");
+        assert_eq!(found.offset, subkey.offset);
+        
+        let found = root.subkey_by_name(&name.to_lowercase()).expect("Lookup should ignore case");
+        assert_eq!(found.offset, subkey.offset);
+    }
+    
+    assert!(root.subkey_by_name("NoSuchKey-reg-rs").is_err());
+}
+
+#[test]
+fn test_subkey_at_matches_subkeys() {
+    let path = test_data_path("SYSTEM");
+    let hive = Hive::open(&path).expect("Failed to open SYSTEM hive");
+    
+    let root = hive.root_key().expect("Failed to get root key");
+    let subkeys = root.subkeys().expect("Failed to get subkeys");
+    
+    for (index, subkey) in subkeys.iter().enumerate() {
+        let at = root
+            .subkey_at(index)
+            .expect("Failed to get subkey by index")
+            .expect("Index should be in range");
+        assert_eq!(at.offset, subkey.offset);
+    }
+    
+    assert!(root.subkey_at(subkeys.len()).unwrap().is_none());
+    assert!(root.value_at(root.value_count().unwrap() as usize).unwrap().is_none());
+}
+
 #[test]
 fn test_enumerate_values_system() {
     let path = test_data_path("SYSTEM");
@@ -169,7 +232,7 @@ fn test_deep_traversal_system() {
     let mut value_count = 0;
     
     fn count_recursive(
-        key: &reg_parser::RegistryKey,
+        key: &regrs::RegistryKey,
         key_count: &mut usize,
         value_count: &mut usize,
         depth: usize,
@@ -200,6 +263,33 @@ fn test_deep_traversal_system() {
     assert!(key_count > 0, "Should have found some keys");
 }
 
+#[test]
+fn test_walk_matches_recursive_traversal() {
+    let path = test_data_path("SYSTEM");
+    let hive = Hive::open(&path).expect("Failed to open SYSTEM hive");
+    
+    fn collect(key: &regrs::RegistryKey, parent: Option<u32>, keys: &mut Vec<(u32, Option<u32>)>) {
+        keys.push((key.offset, parent));
+        for subkey in key.subkeys().expect("Failed to get subkeys") {
+            collect(&subkey, Some(key.offset), keys);
+        }
+    }
+    
+    let root = hive.root_key().expect("Failed to get root key");
+    let mut expected = Vec::new();
+    collect(&root, None, &mut expected);
+    
+    let walked = hive.walk(root.offset).expect("Failed to walk hive");
+    assert_eq!(walked[0].offset, root.offset);
+    assert_eq!(walked[0].parent, None);
+    assert_eq!(walked[0].name, root.name().unwrap());
+    
+    let mut keys: Vec<(u32, Option<u32>)> = walked.iter().map(|key| (key.offset, key.parent)).collect();
+    keys.sort_unstable();
+    expected.sort_unstable();
+    assert_eq!(keys, expected);
+}
+
 #[test]
 fn test_value_types() {
     let path = test_data_path("SOFTWARE");
@@ -208,7 +298,7 @@ fn test_value_types() {
     let root = hive.root_key().expect("Failed to get root key");
     
     // Search for different value types
-    fn find_value_types(key: &reg_parser::RegistryKey, depth: usize) {
+    fn find_value_types(key: &regrs::RegistryKey, depth: usize) {
         if depth > 5 {
             return;
         }
@@ -275,6 +365,27 @@ fn test_hbin_iteration() {
     assert!(hbin_count > 0, "Should have found at least one hbin");
 }
 
+#[test]
+fn test_find_cells_system() {
+    let path = test_data_path("SYSTEM");
+    let hive = Hive::open(&path).expect("Failed to open SYSTEM hive");
+    
+    let cells = hive.find_cells(b"nk");
+    assert!(cells.iter().all(|cell| cell.cell_type() == Some(*b"nk")));
+    
+    // Every live key is an allocated nk cell
+    let root = hive.root_key().expect("Failed to get root key");
+    let mut expected = vec![root.offset];
+    expected.extend(root.subkey_offsets().expect("Failed to get subkey offsets"));
+    for offset in expected {
+        assert!(
+            cells.iter().any(|cell| cell.offset == offset && cell.is_allocated),
+            "Key at {:#x} not found by scan",
+            offset
+        );
+    }
+}
+
 #[test]
 fn test_all_hives_open() {
     let hive_files = [
@@ -1,6 +1,6 @@
 //! Unit tests for parsing specific structures.
 
-use reg_parser::*;
+use regrs::*;
 
 #[test]
 fn test_base_block_constants() {
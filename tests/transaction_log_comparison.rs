@@ -3,14 +3,13 @@
 //! This test opens all hives in test_data, applies their transaction logs,
 //! and dumps all keys and values from both versions for comparison.
 
-use reg_parser::{Hive, RegistryKey};
+use regrs::{Hive, RegistryKey};
 use std::collections::HashMap;
 use std::path::Path;
 
 /// Represents a dumped registry key with its values.
 #[derive(Debug, Clone)]
 struct DumpedKey {
-    path: String,
     value_count: u32,
     subkey_count: u32,
     values: HashMap<String, String>,
@@ -37,7 +36,6 @@ fn dump_registry_tree(
     dump.insert(
         path.clone(),
         DumpedKey {
-            path: path.clone(),
             value_count: key.value_count()?,
             subkey_count: key.subkey_count()?,
             values,
@@ -186,6 +184,7 @@ fn test_hive_with_logs(
         // Compare
         println!("\n  Comparison:");
         let stats = compare_dumps(&base_dump, &with_logs_dump);
+        println!("    Keys: {} -> {}", stats.total_keys_base, stats.total_keys_with_logs);
         println!("    Keys added: {}", stats.keys_added);
         println!("    Keys removed: {}", stats.keys_removed);
         println!("    Keys modified: {}", stats.keys_modified);